@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import os
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StackConfig:
     cloud: list[str]
     languages: list[str]
@@ -20,19 +26,19 @@ class StackConfig:
     asset_criticality: AssetCriticalityConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotifierTarget:
     type: str
     settings: dict[str, Any]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     targets: list[NotifierTarget]
     used_legacy: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     poll_interval_minutes: int
     state_file: str
@@ -42,31 +48,33 @@ class Settings:
     user_agent: str
     max_notifications_per_run: int
     min_cvss_score: float | None
+    feed_timeout_seconds: int = 120
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RSSFeedConfig:
     name: str
     url: str
+    newest_first: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HackerNewsConfig:
     enabled: bool
     max_terms: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OSVConfig:
     enabled: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CISAConfig:
     enabled: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeedsConfig:
     nvd: bool
     github: bool
@@ -77,7 +85,7 @@ class FeedsConfig:
     cisa: CISAConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     mode: str
     mode_explicit: bool
@@ -90,13 +98,13 @@ class Config:
     scoring: ScoringConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StackDepsSource:
     type: str
     path: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StackDepsConfig:
     enabled: bool
     sources: list[StackDepsSource]
@@ -104,31 +112,75 @@ class StackDepsConfig:
     ecosystems: list[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StackMatchConfig:
     mode: str
     synonyms: bool
     normalize_names: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssetCriticalityConfig:
     services: dict[str, float]
     packages: dict[str, float]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ScoringWeights:
+    severity: float = 0.45
+    exploitability: float = 0.25
+    relevance: float = 0.2
+    recency: float = 0.1
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringThresholds:
+    P0: int = 85
+    P1: int = 70
+    P2: int = 50
+    P3: int = 0
+
+
+@dataclass(frozen=True, slots=True)
 class ScoringConfig:
     enabled: bool
-    weights: dict[str, float]
-    thresholds: dict[str, int]
+    weights: ScoringWeights
+    thresholds: ScoringThresholds
     prefer_sources: list[str]
     keywords: dict[str, list[str]]
+    # Derived once so score_alert reads plain tuples per item.
+    weight_vector: tuple[float, float, float, float] = field(init=False, repr=False, compare=False)
+    priority_cutoffs: tuple[tuple[int, str], ...] = field(init=False, repr=False, compare=False)
+    exploited_keywords: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    poc_keywords: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    preferred_sources: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        weights, thresholds = self.weights, self.thresholds
+        object.__setattr__(
+            self,
+            "weight_vector",
+            (weights.severity, weights.exploitability, weights.relevance, weights.recency),
+        )
+        # Order is significant: _priority_for_score returns the first cutoff the
+        # score reaches, so P0 must be checked before P1 and P2, as the old if/elif did.
+        object.__setattr__(
+            self,
+            "priority_cutoffs",
+            ((thresholds.P0, "P0"), (thresholds.P1, "P1"), (thresholds.P2, "P2")),
+        )
+        object.__setattr__(
+            self,
+            "exploited_keywords",
+            tuple(keyword.lower() for keyword in self.keywords.get("exploited_in_wild", [])),
+        )
+        object.__setattr__(self, "poc_keywords", tuple(keyword.lower() for keyword in self.keywords.get("poc", [])))
+        object.__setattr__(self, "preferred_sources", frozenset(source.lower() for source in self.prefer_sources))
 
 
 def _expand_env(value: Any) -> Any:
     if isinstance(value, str):
-        return os.path.expandvars(value)
+        return os.path.expandvars(value) if "$" in value else value
     if isinstance(value, list):
         return [_expand_env(item) for item in value]
     if isinstance(value, dict):
@@ -149,12 +201,23 @@ def _require_list(value: Any, name: str) -> list[str]:
         return []
     if not isinstance(value, list):
         raise ValueError(f"{name} must be a list")
-    return [str(item) for item in value]
+    for item in value:
+        if type(item) is not str:
+            return [str(entry) for entry in value]
+    return value
 
 
 def load_config(path: str) -> Config:
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+    # Results are shared between callers while the file is unchanged; treat
+    # the returned Config as read-only.
+    resolved = os.path.abspath(path)
+    return _load_config_cached(resolved, os.stat(resolved).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Config:
+    with open(path, "rb") as handle:
+        raw = yaml.load(handle, Loader=_YamlLoader) or {}
 
     data = _expand_env(raw)
     if not isinstance(data, dict):
@@ -181,6 +244,7 @@ def load_config(path: str) -> Config:
         user_agent=str(settings_raw.get("user_agent", "signl/0.1")),
         max_notifications_per_run=int(settings_raw.get("max_notifications_per_run", 25)),
         min_cvss_score=_parse_min_cvss(settings_raw.get("min_cvss_score")),
+        feed_timeout_seconds=int(settings_raw.get("feed_timeout_seconds", 120)),
     )
 
     feeds = _load_feeds(_require_dict(data.get("feeds"), "feeds"))
@@ -303,7 +367,8 @@ def _load_notifications(data: dict[str, Any]) -> NotificationConfig:
             target_type = entry.get("type")
             if not target_type:
                 raise ValueError("notify entries must include type")
-            settings = {k: v for k, v in entry.items() if k != "type"}
+            settings = dict(entry)
+            settings.pop("type", None)
             targets.append(NotifierTarget(type=str(target_type), settings=settings))
 
     notifications_raw = _require_dict(data.get("notifications"), "notifications")
@@ -325,18 +390,18 @@ def _load_scoring(raw: dict[str, Any]) -> ScoringConfig:
     weights_raw = _require_dict(raw.get("weights"), "scoring.weights")
     thresholds_raw = _require_dict(raw.get("thresholds"), "scoring.thresholds")
     keywords_raw = _require_dict(raw.get("keywords"), "scoring.keywords")
-    weights = {
-        "severity": float(weights_raw.get("severity", 0.45)),
-        "exploitability": float(weights_raw.get("exploitability", 0.25)),
-        "relevance": float(weights_raw.get("relevance", 0.2)),
-        "recency": float(weights_raw.get("recency", 0.1)),
-    }
-    thresholds = {
-        "P0": int(thresholds_raw.get("P0", 85)),
-        "P1": int(thresholds_raw.get("P1", 70)),
-        "P2": int(thresholds_raw.get("P2", 50)),
-        "P3": int(thresholds_raw.get("P3", 0)),
-    }
+    weights = ScoringWeights(
+        severity=float(weights_raw.get("severity", 0.45)),
+        exploitability=float(weights_raw.get("exploitability", 0.25)),
+        relevance=float(weights_raw.get("relevance", 0.2)),
+        recency=float(weights_raw.get("recency", 0.1)),
+    )
+    thresholds = ScoringThresholds(
+        P0=int(thresholds_raw.get("P0", 85)),
+        P1=int(thresholds_raw.get("P1", 70)),
+        P2=int(thresholds_raw.get("P2", 50)),
+        P3=int(thresholds_raw.get("P3", 0)),
+    )
     keywords = {
         "exploited_in_wild": _require_list(
             keywords_raw.get("exploited_in_wild"), "scoring.keywords.exploited_in_wild"
@@ -365,7 +430,9 @@ def _load_feeds(raw: dict[str, Any]) -> FeedsConfig:
             url = entry.get("url")
             if not name or not url:
                 raise ValueError("feeds.rss entries must include name and url")
-            rss_list.append(RSSFeedConfig(name=str(name), url=str(url)))
+            rss_list.append(
+                RSSFeedConfig(name=str(name), url=str(url), newest_first=bool(entry.get("newest_first", False)))
+            )
 
     hn_raw = _require_dict(raw.get("hackernews"), "feeds.hackernews")
     hn = HackerNewsConfig(
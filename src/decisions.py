@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import re
 
 from .feeds.base import FeedItem
 from .matcher import MatchResult
@@ -21,9 +23,13 @@ CAMPAIGN_PHRASES = (
     "apt",
     "ransomware",
 )
+# Case-sensitive on purpose: the phrases are lowercase and must only be searched
+# in already-lowercased text (FeedItem.text_lower).
+_EXPLOIT_RE = re.compile("|".join(map(re.escape, EXPLOIT_PHRASES)))
+_CAMPAIGN_RE = re.compile("|".join(map(re.escape, CAMPAIGN_PHRASES)))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlertDecision:
     immediate: bool
     reason: str
@@ -116,33 +122,50 @@ def classify_alert(
 def _match_always_page(item: FeedItem, match: MatchResult, always_page: list[str]) -> str | None:
     if not match.is_relevant or not always_page:
         return None
-    text_bits = [
-        item.title,
-        item.description,
-        " ".join(item.affected_packages),
-        " ".join(item.affected_services),
-    ]
-    haystack = " ".join(bit for bit in text_bits if bit).lower()
-    for keyword in always_page:
-        needle = keyword.strip().lower()
-        if needle and needle in haystack:
+    pattern, keywords = _always_page_matcher(tuple(always_page))
+    if pattern is None:
+        return None
+    text_bits = (
+        item.text_lower,
+        " ".join(item.affected_packages).lower(),
+        " ".join(item.affected_services).lower(),
+    )
+    haystack = " ".join(filter(None, text_bits))
+    if pattern.search(haystack) is None:
+        return None
+    # Report the first configured keyword that matches, not the leftmost hit.
+    for needle, keyword in keywords:
+        if needle in haystack:
             return keyword
     return None
 
 
+@lru_cache(maxsize=32)
+def _always_page_matcher(
+    always_page: tuple[str, ...],
+) -> tuple[re.Pattern[str] | None, tuple[tuple[str, str], ...]]:
+    keywords: dict[str, str] = {}
+    for keyword in always_page:
+        needle = keyword.strip().lower()
+        if needle and needle not in keywords:
+            keywords[needle] = keyword
+    if not keywords:
+        return None, ()
+    pattern = re.compile("|".join(re.escape(needle) for needle in keywords))
+    return pattern, tuple(keywords.items())
+
+
 def _confidence_signal(item: FeedItem) -> tuple[bool, str]:
-    if item.source.lower() == "cisa" or "kev" in [tag.lower() for tag in item.tags]:
+    source = item.source.lower()
+    if source == "cisa" or "kev" in item.tags_lower:
         return True, "CISA KEV"
 
-    text = f"{item.title} {item.description}".lower()
-    for phrase in EXPLOIT_PHRASES:
-        if phrase in text:
-            return True, "exploited in the wild"
-    for phrase in CAMPAIGN_PHRASES:
-        if phrase in text:
-            return True, "active campaign or threat actor mention"
-    if item.source.lower() in TRUSTED_SOURCES:
-        return True, f"trusted source ({item.source.upper()})"
+    if _EXPLOIT_RE.search(item.text_lower):
+        return True, "exploited in the wild"
+    if _CAMPAIGN_RE.search(item.text_lower):
+        return True, "active campaign or threat actor mention"
+    if source in TRUSTED_SOURCES:
+        return True, f"trusted source ({source.upper()})"
     return False, "no high-confidence signal"
 
 
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
+from itertools import chain
 from pathlib import Path
 import re
-from typing import Any
+import sys
+from typing import Any, Iterable, Iterator
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ..json_codec import parse_json
 from .normalize import normalize_package_name
 from .types import DependencyGraph
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependencySource:
     type: str
     path: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependenciesConfig:
     enabled: bool
     sources: list[DependencySource]
@@ -24,7 +31,12 @@ class DependenciesConfig:
     ecosystems: list[str]
 
 
-_REQ_SPLIT = re.compile(r"[<>=!~]")
+_REQ_SEPARATORS = str.maketrans(dict.fromkeys("<>=!~", "\x00"))
+# Matched against raw bytes so large lockfiles are never decoded as a whole.
+_POETRY_PACKAGE_NAME = re.compile(
+    rb'^\[\[package\]\][ \t\r]*$[^\[]*?^[ \t]*name[ \t]*=[ \t]*"([^"]+)"',
+    re.MULTILINE,
+)
 
 
 def load_dependency_graph(
@@ -36,7 +48,10 @@ def load_dependency_graph(
     if not config.enabled:
         return graph
 
-    allowed_ecosystems = {eco.lower() for eco in config.ecosystems} if config.ecosystems else None
+    # Source types and ecosystems are normalized here only; config passes them through as written.
+    allowed_ecosystems = (
+        {sys.intern(eco.lower()) for eco in config.ecosystems} if config.ecosystems else None
+    )
     for source in config.sources:
         path = (base_dir / source.path).expanduser()
         if not path.exists():
@@ -85,12 +100,12 @@ def _load_package_json(
 ) -> None:
     if allowed_ecosystems and "npm" not in allowed_ecosystems:
         return
-    data = json.loads(path.read_text(encoding="utf-8"))
-    dependencies = _extract_package_names(data.get("dependencies")) | _extract_package_names(
-        data.get("devDependencies")
+    data = parse_json(path.read_bytes())
+    names = chain(
+        _iter_package_names(data.get("dependencies")),
+        _iter_package_names(data.get("devDependencies")),
     )
-    normalized = {normalize_package_name(name, "npm", normalize_names) for name in dependencies}
-    graph.add_direct("npm", normalized)
+    graph.add_direct("npm", {normalize_package_name(name, "npm", normalize_names) for name in names})
 
 
 def _load_package_lock(
@@ -101,19 +116,20 @@ def _load_package_lock(
 ) -> None:
     if allowed_ecosystems and "npm" not in allowed_ecosystems:
         return
-    data = json.loads(path.read_text(encoding="utf-8"))
-    packages: set[str] = set()
-    if isinstance(data.get("packages"), dict):
-        for name in data["packages"].keys():
-            if not name:
-                continue
-            if name.startswith("node_modules/"):
-                name = name.split("node_modules/", 1)[1]
-            packages.add(name)
-    elif isinstance(data.get("dependencies"), dict):
-        packages |= _extract_npm_dependencies(data["dependencies"])
-    normalized = {normalize_package_name(name, "npm", normalize_names) for name in packages}
-    graph.add_transitive("npm", normalized)
+    if ijson is not None:
+        names = _stream_lockfile_names(path)
+        if names is None:
+            return
+    else:
+        data = parse_json(path.read_bytes())
+        if isinstance(data.get("packages"), dict):
+            names = _iter_lockfile_packages(data["packages"])
+        elif isinstance(data.get("dependencies"), dict):
+            names = _iter_npm_dependencies(data["dependencies"])
+        else:
+            return
+    # Nested node_modules repeat the same package many times; normalize each name once.
+    graph.add_transitive("npm", {normalize_package_name(name, "npm", normalize_names) for name in set(names)})
 
 
 def _load_requirements(
@@ -124,16 +140,11 @@ def _load_requirements(
 ) -> None:
     if allowed_ecosystems and "pip" not in allowed_ecosystems:
         return
-    packages: set[str] = set()
-    for line in path.read_text(encoding="utf-8").splitlines():
-        cleaned = line.strip()
-        if not cleaned or cleaned.startswith("#") or cleaned.startswith("-"):
-            continue
-        name = _REQ_SPLIT.split(cleaned, 1)[0]
-        name = name.split("[", 1)[0]
-        if name:
-            packages.add(name.strip())
-    normalized = {normalize_package_name(name, "pip", normalize_names) for name in packages}
+    with path.open("r", encoding="utf-8") as handle:
+        normalized = {
+            normalize_package_name(name, "pip", normalize_names)
+            for name in _iter_requirement_names(handle)
+        }
     graph.add_direct("pip", normalized)
 
 
@@ -145,35 +156,82 @@ def _load_poetry_lock(
 ) -> None:
     if allowed_ecosystems and "pip" not in allowed_ecosystems:
         return
-    packages: set[str] = set()
-    current: dict[str, Any] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
+    data = path.read_bytes()
+    normalized = {
+        normalize_package_name(name.decode("utf-8"), "pip", normalize_names)
+        for name in _POETRY_PACKAGE_NAME.findall(data)
+    }
+    graph.add_transitive("pip", normalized)
+
+
+def _iter_requirement_names(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
         cleaned = line.strip()
-        if cleaned == "[[package]]":
-            if current.get("name"):
-                packages.add(current["name"])
-            current = {}
+        if not cleaned or cleaned.startswith("#") or cleaned.startswith("-"):
             continue
-        if cleaned.startswith("name ="):
-            name = cleaned.split("=", 1)[1].strip().strip('"')
-            current["name"] = name
-    if current.get("name"):
-        packages.add(current["name"])
-    normalized = {normalize_package_name(name, "pip", normalize_names) for name in packages}
-    graph.add_transitive("pip", normalized)
+        name = cleaned.translate(_REQ_SEPARATORS).partition("\x00")[0]
+        name = name.split("[", 1)[0]
+        if name:
+            yield name.strip()
 
 
-def _extract_package_names(data: Any) -> set[str]:
+def _iter_package_names(data: Any) -> Iterator[str]:
     if not isinstance(data, dict):
-        return set()
-    return {str(name) for name in data.keys()}
-
-
-def _extract_npm_dependencies(data: dict[str, Any]) -> set[str]:
-    packages: set[str] = set()
-    for name, metadata in data.items():
-        packages.add(str(name))
-        deps = metadata.get("dependencies")
-        if isinstance(deps, dict):
-            packages |= _extract_npm_dependencies(deps)
-    return packages
+        return
+    for name in data.keys():
+        yield str(name)
+
+
+def _stream_lockfile_names(path: Path) -> Iterator[str] | None:
+    # One streaming pass serves both formats: v2/v3 "packages" keys end the
+    # read as soon as that map closes, otherwise v1 nested "dependencies"
+    # names are collected on the way through.
+    packages: list[str] = []
+    nested: list[str] = []
+    seen_packages = False
+    containers: list[str | None] = []
+    key: str | None = None
+    with path.open("rb") as handle:
+        for event, value in ijson.basic_parse(handle):
+            if event == "map_key":
+                key = value
+                if containers == [None, "packages"]:
+                    packages.append(value)
+                elif _is_dependency_map(containers):
+                    nested.append(value)
+            elif event in ("start_map", "start_array"):
+                containers.append(key)
+                key = None
+            elif event in ("end_map", "end_array"):
+                if containers.pop() == "packages" and containers == [None] and event == "end_map":
+                    seen_packages = True
+                    break
+                key = None
+    if seen_packages:
+        return _iter_lockfile_packages(packages)
+    return iter(nested) if nested else None
+
+
+def _is_dependency_map(containers: list[str | None]) -> bool:
+    # Below the root, v1 nests as dependencies.<name>.dependencies.<name>...
+    path = containers[1:]
+    return len(path) % 2 == 1 and all(key == "dependencies" for key in path[::2])
+
+
+def _iter_lockfile_packages(packages: Iterable[str]) -> Iterator[str]:
+    for name in packages:
+        if not name:
+            continue
+        # "node_modules/a/node_modules/@scope/b" is the nested package "@scope/b".
+        yield name.rpartition("node_modules/")[2]
+
+
+def _iter_npm_dependencies(data: dict[str, Any]) -> Iterator[str]:
+    pending = [data]
+    while pending:
+        current = pending.pop()
+        for name, metadata in current.items():
+            yield str(name)
+            deps = metadata.get("dependencies") if isinstance(metadata, dict) else None
+            if isinstance(deps, dict):
+                pending.append(deps)
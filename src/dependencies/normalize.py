@@ -5,10 +5,14 @@ def normalize_package_name(name: str, ecosystem: str | None, normalize_names: bo
     cleaned = name.strip()
     if not normalize_names:
         return cleaned
-    lowered = cleaned.lower()
-    ecosystem_name = (ecosystem or "").lower()
+    ecosystem_name = ecosystem.lower() if ecosystem else ""
     if ecosystem_name in {"pip", "pypi"}:
-        return lowered.replace("_", "-").replace(".", "-")
+        if cleaned.islower() and "_" not in cleaned and "." not in cleaned:
+            return cleaned
+        # Chained replace() beats a str.translate table for these short ASCII names.
+        return cleaned.lower().replace("_", "-").replace(".", "-")
     if ecosystem_name == "npm":
-        return lowered.replace("_", "-")
-    return lowered
+        if cleaned.islower() and "_" not in cleaned:
+            return cleaned
+        return cleaned.lower().replace("_", "-")
+    return cleaned.lower()
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-@dataclass
+_SEVERITY_NAMES = {
+    variant: name
+    for name in ("none", "low", "medium", "moderate", "high", "critical", "unknown")
+    for variant in (name, name.upper(), name.capitalize())
+}
+
+
+@dataclass(slots=True)
 class FeedItem:
     id: str
     source: str
@@ -21,6 +28,12 @@ class FeedItem:
     affected_services: list[str] = field(default_factory=list)
     affected_cloud: list[str] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
+    text_lower: str = field(init=False, repr=False, compare=False)
+    tags_lower: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.text_lower = " ".join(bit for bit in (self.title, self.description) if bit).lower()
+        self.tags_lower = frozenset(tag.lower() for tag in self.tags)
 
 
 class BaseFeed(ABC):
@@ -28,3 +41,18 @@ class BaseFeed(ABC):
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         """Fetch items published since the given datetime. If None, fetch last 24 hours."""
         raise NotImplementedError
+
+
+def parse_iso_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 feed timestamp as an aware UTC datetime; naive values are taken as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def normalize_severity(value: str | None) -> str | None:
+    """Lowercase a feed severity label, via a lookup for the known labels."""
+    if not value:
+        return None
+    return _SEVERITY_NAMES.get(value) or value.lower()
@@ -3,77 +3,98 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+from ..json_codec import parse_json
+from .base import BaseFeed, FeedItem, parse_iso_timestamp
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 CISA_ENDPOINT = "https://www.cisa.gov/sites/default/files/feeds/known_exploited_vulnerabilities.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CISASettings:
-    timeout_seconds: int
     user_agent: str
 
 
 class CISAFeed(BaseFeed):
-    def __init__(self, settings: CISASettings) -> None:
+    def __init__(self, settings: CISASettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         start = since or (datetime.now(timezone.utc) - timedelta(days=1))
         headers = {"User-Agent": self._settings.user_agent}
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            response = await client.get(CISA_ENDPOINT, headers=headers)
+        if ijson is None:
+            response = await self._client.get(CISA_ENDPOINT, headers=headers)
             response.raise_for_status()
-            payload = response.json()
-
-        return _parse_items(payload, start)
+            return _parse_items(parse_json(response.content), start)
+
+        # The catalog only grows; stream it so entries outside the window are
+        # dropped as they are decoded instead of after loading the whole file.
+        results: list[FeedItem] = []
+        entries = ijson.sendable_list()
+        parser = ijson.items_coro(entries, "vulnerabilities.item", use_float=True)
+        async with self._client.stream("GET", CISA_ENDPOINT, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                results.extend(_parse_entries(entries, start))
+                del entries[:]
+        parser.close()
+        results.extend(_parse_entries(entries, start))
+        return results
 
 
 def _parse_items(payload: dict[str, Any], since: datetime) -> list[FeedItem]:
-    results: list[FeedItem] = []
-    vulnerabilities = payload.get("vulnerabilities", [])
-    for entry in vulnerabilities:
-        cve_id = entry.get("cveID")
-        if not cve_id:
-            continue
-        published = _parse_date(entry.get("dateAdded"))
-        if published < since:
-            continue
-        title = entry.get("vulnerabilityName") or cve_id
-        description = entry.get("shortDescription") or ""
-        url = f"https://nvd.nist.gov/vuln/detail/{cve_id}"
-        results.append(
-            FeedItem(
-                id=f"cisa:{cve_id}",
-                source="cisa",
-                title=f"{cve_id}: {title}",
-                description=description,
-                url=url,
-                published=published,
-                severity=None,
-                cvss_score=None,
-                affected_packages=[],
-                raw_data=entry,
-                tags=["kev"],
-            )
-        )
-    return results
+    return list(_parse_entries(payload.get("vulnerabilities", []), since))
+
+
+def _parse_entries(entries: list[dict[str, Any]], since: datetime) -> Iterator[FeedItem]:
+    for entry in entries:
+        item = _parse_entry(entry, since)
+        if item:
+            yield item
+
+
+def _parse_entry(entry: dict[str, Any], since: datetime) -> FeedItem | None:
+    cve_id = entry.get("cveID")
+    if not cve_id:
+        return None
+    published = _parse_date(entry.get("dateAdded"))
+    if published < since:
+        return None
+    title = entry.get("vulnerabilityName") or cve_id
+    description = entry.get("shortDescription") or ""
+    url = f"https://nvd.nist.gov/vuln/detail/{cve_id}"
+    return FeedItem(
+        id=f"cisa:{cve_id}",
+        source="cisa",
+        title=f"{cve_id}: {title}",
+        description=description,
+        url=url,
+        published=published,
+        severity=None,
+        cvss_score=None,
+        affected_packages=[],
+        raw_data=entry,
+        tags=["kev"],
+    )
 
 
 def _parse_date(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
     try:
-        parsed = datetime.fromisoformat(value)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
+        return parse_iso_timestamp(value)
     except ValueError:
         return datetime.now(timezone.utc)
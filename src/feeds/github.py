@@ -4,27 +4,29 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
 import os
+import sys
 from typing import Any
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+from ..json_codec import parse_json
+from .base import BaseFeed, FeedItem, normalize_severity, parse_iso_timestamp
 
 
 GITHUB_ADVISORIES_ENDPOINT = "https://api.github.com/advisories"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitHubSettings:
     ecosystems: list[str]
     max_results: int
-    timeout_seconds: int
     user_agent: str
 
 
 class GitHubFeed(BaseFeed):
-    def __init__(self, settings: GitHubSettings) -> None:
+    def __init__(self, settings: GitHubSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
@@ -42,39 +44,42 @@ class GitHubFeed(BaseFeed):
         page = 1
         per_page = min(self._settings.max_results, 100)
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "per_page": per_page,
-                    "page": page,
-                }
-                if len(self._settings.ecosystems) == 1:
-                    params["ecosystem"] = self._settings.ecosystems[0]
-                if since:
-                    params["since"] = _to_iso(start)
-
-                response = await client.get(GITHUB_ADVISORIES_ENDPOINT, headers=headers, params=params)
-                if response.status_code == 403 and "rate limit" in response.text.lower():
-                    reset = response.headers.get("X-RateLimit-Reset")
-                    self._logger.warning(
-                        "GitHub rate limit hit; reset at %s (set GITHUB_TOKEN to raise limits)",
-                        reset or "unknown",
-                    )
-                    break
-                response.raise_for_status()
-                payload = response.json()
-                if not payload:
-                    break
-
-                items.extend(_parse_items(payload))
-                if len(items) >= self._settings.max_results:
-                    return items[: self._settings.max_results]
-
-                if since and _all_older_than(payload, start):
-                    break
-                if len(payload) < per_page:
-                    break
-                page += 1
+        while True:
+            params: dict[str, Any] = {
+                "per_page": per_page,
+                "page": page,
+            }
+            if len(self._settings.ecosystems) == 1:
+                params["ecosystem"] = self._settings.ecosystems[0]
+            if since:
+                params["since"] = _to_iso(start)
+
+            response = await self._client.get(GITHUB_ADVISORIES_ENDPOINT, headers=headers, params=params)
+            if response.status_code == 403 and "rate limit" in response.text.lower():
+                reset = response.headers.get("X-RateLimit-Reset")
+                self._logger.warning(
+                    "GitHub rate limit hit; reset at %s (set GITHUB_TOKEN to raise limits)",
+                    reset or "unknown",
+                )
+                break
+            response.raise_for_status()
+            payload = parse_json(response.content)
+            if not payload:
+                break
+
+            page_items = _parse_items(payload)
+            remaining = self._settings.max_results - len(items)
+            if len(page_items) >= remaining:
+                items.extend(page_items[:remaining])
+                return items
+            items.extend(page_items)
+
+            # Advisories come back newest-first, so the last one is the oldest.
+            if since and page_items and page_items[-1].published < start:
+                break
+            if len(payload) < per_page:
+                break
+            page += 1
 
         return items
 
@@ -87,7 +92,7 @@ def _parse_items(entries: list[dict[str, Any]]) -> list[FeedItem]:
             continue
         title = entry.get("summary") or ghsa_id
         description = entry.get("description") or entry.get("summary") or ""
-        severity = _normalize_severity(entry.get("severity"))
+        severity = normalize_severity(entry.get("severity"))
         published = _parse_datetime(entry.get("published_at"))
         url = entry.get("html_url") or ""
         affected, ecosystems = _extract_packages(entry.get("vulnerabilities", []))
@@ -110,43 +115,19 @@ def _parse_items(entries: list[dict[str, Any]]) -> list[FeedItem]:
 
 
 def _extract_packages(vulnerabilities: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
-    packages: set[str] = set()
-    ecosystems: set[str] = set()
-    for vuln in vulnerabilities:
-        package = vuln.get("package", {})
-        name = package.get("name")
-        ecosystem = package.get("ecosystem")
-        if name:
-            packages.add(name)
-        if ecosystem:
-            ecosystems.add(str(ecosystem).lower())
-    return sorted(packages), sorted(ecosystems)
-
-
-def _normalize_severity(value: str | None) -> str | None:
-    if not value:
-        return None
-    return value.lower()
+    packages = [vuln.get("package", {}) for vuln in vulnerabilities]
+    names = dict.fromkeys(sys.intern(package["name"]) for package in packages if package.get("name"))
+    ecosystems = dict.fromkeys(
+        sys.intern(str(package["ecosystem"]).lower()) for package in packages if package.get("ecosystem")
+    )
+    return list(names), list(ecosystems)
 
 
 def _parse_datetime(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
-    if value.endswith("Z"):
-        value = value[:-1] + "+00:00"
-    parsed = datetime.fromisoformat(value)
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=timezone.utc)
-    return parsed
+    return parse_iso_timestamp(value)
 
 
 def _to_iso(value: datetime) -> str:
     return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
-def _all_older_than(payload: list[dict[str, Any]], cutoff: datetime) -> bool:
-    for entry in payload:
-        published = _parse_datetime(entry.get("published_at"))
-        if published >= cutoff:
-            return False
-    return True
@@ -2,28 +2,31 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
 from typing import Any
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+from ..json_codec import parse_json
+from .base import BaseFeed, FeedItem, parse_iso_timestamp
 
 
 HN_ENDPOINT = "https://hn.algolia.com/api/v1/search_by_date"
+HN_CONCURRENCY = 4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HackerNewsSettings:
     terms: list[str]
     max_results: int
-    timeout_seconds: int
     user_agent: str
 
 
 class HackerNewsFeed(BaseFeed):
-    def __init__(self, settings: HackerNewsSettings) -> None:
+    def __init__(self, settings: HackerNewsSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
@@ -35,31 +38,51 @@ class HackerNewsFeed(BaseFeed):
         results: list[FeedItem] = []
         seen: set[str] = set()
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            for term in self._settings.terms:
-                params = {
-                    "query": term,
-                    "tags": "story",
-                    "numericFilters": f"created_at_i>{since_epoch}",
-                    "hitsPerPage": min(self._settings.max_results, 20),
-                }
-                response = await client.get(HN_ENDPOINT, params=params, headers=headers)
-                response.raise_for_status()
-                payload = response.json()
-                for hit in payload.get("hits", []):
-                    item = _parse_hit(hit)
-                    if not item:
-                        continue
-                    if item.id in seen:
-                        continue
-                    seen.add(item.id)
-                    results.append(item)
-                    if len(results) >= self._settings.max_results:
-                        return results
+        per_page = min(self._settings.max_results, 20)
+        semaphore = asyncio.Semaphore(HN_CONCURRENCY)
+
+        # A failed search cancels its siblings instead of leaving them running.
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(_search_term(self._client, semaphore, headers, term, since_epoch, per_page))
+                for term in self._settings.terms
+            ]
+
+        for payload in (task.result() for task in tasks):
+            for hit in payload.get("hits", []):
+                item = _parse_hit(hit)
+                if not item:
+                    continue
+                if item.id in seen:
+                    continue
+                seen.add(item.id)
+                results.append(item)
+                if len(results) >= self._settings.max_results:
+                    return results
 
         return results
 
 
+async def _search_term(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    headers: dict[str, str],
+    term: str,
+    since_epoch: int,
+    per_page: int,
+) -> dict[str, Any]:
+    params = {
+        "query": term,
+        "tags": "story",
+        "numericFilters": f"created_at_i>{since_epoch}",
+        "hitsPerPage": per_page,
+    }
+    async with semaphore:
+        response = await client.get(HN_ENDPOINT, params=params, headers=headers)
+    response.raise_for_status()
+    return parse_json(response.content)
+
+
 def _parse_hit(hit: dict[str, Any]) -> FeedItem | None:
     object_id = hit.get("objectID")
     if not object_id:
@@ -87,8 +110,6 @@ def _parse_datetime(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
     try:
-        if value.endswith("Z"):
-            value = value[:-1] + "+00:00"
-        return datetime.fromisoformat(value)
+        return parse_iso_timestamp(value)
     except ValueError:
         return datetime.now(timezone.utc)
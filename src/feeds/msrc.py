@@ -3,51 +3,77 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+import io
 import logging
+import re
 from typing import Any
 import xml.etree.ElementTree as ET
 
 import httpx
 
+try:
+    from lxml.etree import iterparse
+
+    _LXML = True
+except ImportError:
+    from xml.etree.ElementTree import iterparse
+
+    _LXML = False
+
 from .base import BaseFeed, FeedItem
 
 
 MSRC_RSS_ENDPOINT = "https://api.msrc.microsoft.com/update-guide/rss"
 
+_UTC_PUBDATE = re.compile(
+    r"(?:[A-Z][a-z]{2}, )?(\d{1,2}) ([A-Z][a-z]{2}) (\d{4}) (\d\d):(\d\d):(\d\d) (?:GMT|UTC|Z|[+-]0000)$"
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MSRCSettings:
-    timeout_seconds: int
     user_agent: str
 
 
 class MSRCFeed(BaseFeed):
-    def __init__(self, settings: MSRCSettings) -> None:
+    def __init__(self, settings: MSRCSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         start = since or (datetime.now(timezone.utc) - timedelta(days=1))
         headers = {"User-Agent": self._settings.user_agent}
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            response = await client.get(MSRC_RSS_ENDPOINT, headers=headers)
-            response.raise_for_status()
+        response = await self._client.get(MSRC_RSS_ENDPOINT, headers=headers)
+        response.raise_for_status()
 
-        return _parse_rss(response.text, start)
+        return _parse_rss(response.content, start)
 
 
-def _parse_rss(payload: str, since: datetime) -> list[FeedItem]:
+def _parse_rss(payload: bytes, since: datetime) -> list[FeedItem]:
     results: list[FeedItem] = []
-    root = ET.fromstring(payload)
-    for item in root.findall(".//item"):
-        guid = _text(item, "guid") or _text(item, "link")
-        if not guid:
+    # Same hardening as the RSS feed parser: the feed is untrusted XML.
+    options = {"resolve_entities": False, "no_network": True} if _LXML else {}
+    for _, item in iterparse(io.BytesIO(payload), events=("end",), **options):
+        if item.tag != "item":
             continue
+        guid = _text(item, "guid") or _text(item, "link")
         title = _text(item, "title") or guid
         description = _text(item, "description") or ""
         link = _text(item, "link") or ""
-        published = _parse_pubdate(_text(item, "pubDate"))
+        pubdate = _text(item, "pubDate")
+        # Drop the parsed children so memory stays bounded by one item.
+        item.clear()
+        if not guid:
+            continue
+        published = _parse_pubdate(pubdate)
         if published < since:
             continue
         results.append(
@@ -77,6 +103,20 @@ def _text(node: ET.Element, tag: str) -> str | None:
 def _parse_pubdate(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
+    return _parse_rfc822(value)
+
+
+def _parse_rfc822(value: str) -> datetime:
+    # MSRC emits fixed-format UTC dates; only hand anything else to the
+    # lenient email parser.
+    match = _UTC_PUBDATE.match(value)
+    if match:
+        day, month_name, year, hour, minute, second = match.groups()
+        month = _MONTHS.get(month_name)
+        if month:
+            return datetime(
+                int(year), month, int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc
+            )
     parsed = parsedate_to_datetime(value)
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=timezone.utc)
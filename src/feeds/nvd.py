@@ -1,60 +1,92 @@
 from __future__ import annotations
 
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
 import asyncio
+import re
+import sys
 from typing import Any
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+from ..json_codec import parse_json
+from .base import BaseFeed, FeedItem, normalize_severity, parse_iso_timestamp
 
 
 NVD_ENDPOINT = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+NVD_PAGE_INTERVAL = 1.0
+_CPE_PRODUCT = re.compile(r"cpe:2\.3:[aho]:[^:]+:([^:]+)")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NVDSettings:
     max_results: int
-    timeout_seconds: int
     user_agent: str
 
 
 class NVDFeed(BaseFeed):
-    def __init__(self, settings: NVDSettings) -> None:
+    def __init__(self, settings: NVDSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         start = since or (datetime.now(timezone.utc) - timedelta(days=1))
         end = datetime.now(timezone.utc)
         items: list[FeedItem] = []
-        start_index = 0
-        total_results = None
+        page_size = self._settings.max_results
 
         headers = {"User-Agent": self._settings.user_agent}
-
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            while total_results is None or start_index < total_results:
-                params = {
-                    "pubStartDate": _to_iso(start),
-                    "pubEndDate": _to_iso(end),
-                    "resultsPerPage": self._settings.max_results,
-                    "startIndex": start_index,
-                }
-                response = await client.get(NVD_ENDPOINT, headers=headers, params=params)
-                response.raise_for_status()
-                payload = response.json()
-                total_results = int(payload.get("totalResults", 0))
-                vulnerabilities = payload.get("vulnerabilities", [])
-                items.extend(_parse_items(vulnerabilities))
-                start_index += self._settings.max_results
+        base_params = {
+            "pubStartDate": _to_iso(start),
+            "pubEndDate": _to_iso(end),
+            "resultsPerPage": page_size,
+        }
+
+        payload = await self._fetch_page(headers, base_params, 0, delay=0)
+        total_results = int(payload.get("totalResults", 0))
+        start_index = page_size
+        next_page: asyncio.Task[dict[str, Any]] | None = None
+        try:
+            while True:
+                # Request the next page (after the rate-limit pause) while this
+                # one is parsed.
                 if start_index < total_results:
-                    await asyncio.sleep(1)
+                    next_page = asyncio.create_task(
+                        self._fetch_page(headers, base_params, start_index, delay=NVD_PAGE_INTERVAL)
+                    )
+                items.extend(_parse_items(payload.get("vulnerabilities", [])))
+                if next_page is None:
+                    break
+                page, next_page = next_page, None
+                payload = await page
+                start_index += page_size
+        finally:
+            # Parsing failed or the feed was cancelled: drop the prefetch so it
+            # stops using the shared client and its error is not left unretrieved.
+            if next_page is not None:
+                next_page.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await next_page
 
         return items
 
+    async def _fetch_page(
+        self,
+        headers: dict[str, str],
+        base_params: dict[str, Any],
+        start_index: int,
+        delay: float,
+    ) -> dict[str, Any]:
+        if delay:
+            await asyncio.sleep(delay)
+        params = {**base_params, "startIndex": start_index}
+        response = await self._client.get(NVD_ENDPOINT, headers=headers, params=params)
+        response.raise_for_status()
+        return parse_json(response.content)
+
 
 def _parse_items(vulnerabilities: list[dict[str, Any]]) -> list[FeedItem]:
     results: list[FeedItem] = []
@@ -102,31 +134,24 @@ def _cvss_v31(metrics: dict[str, Any]) -> tuple[float | None, str | None]:
     score = cvss.get("baseScore")
     severity = metric.get("baseSeverity")
     if isinstance(severity, str):
-        severity = severity.lower()
+        severity = normalize_severity(severity)
     return score, severity
 
 
 def _extract_cpes(configurations: list[dict[str, Any]]) -> list[str]:
-    packages: set[str] = set()
-    for config in configurations:
-        nodes = config.get("nodes", [])
-        for node in nodes:
-            for match in node.get("cpeMatch", []) or []:
-                criteria = match.get("criteria")
-                if not criteria:
-                    continue
-                parts = criteria.split(":")
-                if len(parts) >= 5:
-                    packages.add(parts[4])
-    return sorted(packages)
+    matches = (
+        _CPE_PRODUCT.match(cpe.get("criteria") or "")
+        for config in configurations
+        for node in config.get("nodes", [])
+        for cpe in node.get("cpeMatch", []) or []
+    )
+    return list(dict.fromkeys(sys.intern(match.group(1)) for match in matches if match))
 
 
 def _parse_datetime(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
-    if value.endswith("Z"):
-        value = value[:-1] + "+00:00"
-    return datetime.fromisoformat(value)
+    return parse_iso_timestamp(value)
 
 
 def _to_iso(value: datetime) -> str:
@@ -2,15 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import asyncio
 import logging
 from typing import Any
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+from ..json_codec import parse_json
+from .base import BaseFeed, FeedItem, parse_iso_timestamp
 
 
-OSV_ENDPOINT = "https://api.osv.dev/v1/query"
+OSV_BATCH_ENDPOINT = "https://api.osv.dev/v1/querybatch"
+OSV_VULN_ENDPOINT = "https://api.osv.dev/v1/vulns/{}"
+OSV_BATCH_SIZE = 1000
+OSV_CONCURRENCY = 8
 
 ECOSYSTEM_MAP = {
     "npm": "npm",
@@ -27,42 +32,127 @@ ECOSYSTEM_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OSVSettings:
     packages: dict[str, list[str]]
     max_results: int
-    timeout_seconds: int
     user_agent: str
 
 
 class OSVFeed(BaseFeed):
-    def __init__(self, settings: OSVSettings) -> None:
+    def __init__(self, settings: OSVSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         start = since or (datetime.now(timezone.utc) - timedelta(days=1))
         items: list[FeedItem] = []
         headers = {"User-Agent": self._settings.user_agent}
-
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            for ecosystem, packages in self._settings.packages.items():
-                internal_ecosystem = ecosystem.lower()
-                osv_ecosystem = ECOSYSTEM_MAP.get(internal_ecosystem, ecosystem)
-                for package in packages:
-                    payload = {"package": {"name": package, "ecosystem": osv_ecosystem}}
-                    response = await client.post(OSV_ENDPOINT, json=payload, headers=headers)
-                    response.raise_for_status()
-                    data = response.json()
-                    for vuln in data.get("vulns", []):
-                        if len(items) >= self._settings.max_results:
-                            return items
-                        item = _parse_vuln(vuln, package, start, internal_ecosystem)
-                        if item:
-                            items.append(item)
+        queries = [
+            (ecosystem.lower(), ECOSYSTEM_MAP.get(ecosystem.lower(), ecosystem), package)
+            for ecosystem, packages in self._settings.packages.items()
+            for package in packages
+        ]
+        if not queries:
+            return items
+        semaphore = asyncio.Semaphore(OSV_CONCURRENCY)
+
+        # A failed request cancels its siblings instead of leaving them running.
+        async with asyncio.TaskGroup() as group:
+            batches = [
+                group.create_task(
+                    _query_batch(self._client, semaphore, headers, queries[offset : offset + OSV_BATCH_SIZE])
+                )
+                for offset in range(0, len(queries), OSV_BATCH_SIZE)
+            ]
+        results = [result for batch in batches for result in batch.result()]
+
+        # Batch results only carry id/modified; a vuln last modified before
+        # the window cannot have been published inside it.
+        matches: list[tuple[str, str, str]] = []
+        for (internal_ecosystem, _, package), result in zip(queries, results):
+            for vuln in result.get("vulns") or []:
+                vuln_id = vuln.get("id")
+                if vuln_id and _parse_datetime(vuln.get("modified")) >= start:
+                    matches.append((internal_ecosystem, package, vuln_id))
+        if not matches:
+            return items
+
+        vuln_ids = list(dict.fromkeys(vuln_id for _, _, vuln_id in matches))
+        async with asyncio.TaskGroup() as group:
+            details = [
+                group.create_task(_fetch_vuln(self._client, semaphore, headers, vuln_id))
+                for vuln_id in vuln_ids
+            ]
+        vulns = {vuln_id: task.result() for vuln_id, task in zip(vuln_ids, details)}
+
+        for internal_ecosystem, package, vuln_id in matches:
+            if len(items) >= self._settings.max_results:
+                return items
+            item = _parse_vuln(vulns[vuln_id], package, start, internal_ecosystem)
+            if item:
+                items.append(item)
         return items
 
 
+async def _query_batch(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    headers: dict[str, str],
+    queries: list[tuple[str, str, str]],
+) -> list[dict[str, Any]]:
+    package_queries = [
+        {"package": {"name": package, "ecosystem": ecosystem}} for _, ecosystem, package in queries
+    ]
+    results = await _post_batch(client, semaphore, headers, package_queries)
+    # Packages with long histories are paged per query; follow each token
+    # until OSV stops returning one.
+    pending = [
+        (index, result["next_page_token"])
+        for index, result in enumerate(results)
+        if result.get("next_page_token")
+    ]
+    while pending:
+        pages = await _post_batch(
+            client,
+            semaphore,
+            headers,
+            [{**package_queries[index], "page_token": token} for index, token in pending],
+        )
+        next_pending = []
+        for (index, _), page in zip(pending, pages):
+            results[index]["vulns"] = (results[index].get("vulns") or []) + (page.get("vulns") or [])
+            if page.get("next_page_token"):
+                next_pending.append((index, page["next_page_token"]))
+        pending = next_pending
+    return results
+
+
+async def _post_batch(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    headers: dict[str, str],
+    queries: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    async with semaphore:
+        response = await client.post(OSV_BATCH_ENDPOINT, json={"queries": queries}, headers=headers)
+    response.raise_for_status()
+    return parse_json(response.content).get("results", [])
+
+
+async def _fetch_vuln(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    headers: dict[str, str],
+    vuln_id: str,
+) -> dict[str, Any]:
+    async with semaphore:
+        response = await client.get(OSV_VULN_ENDPOINT.format(vuln_id), headers=headers)
+    response.raise_for_status()
+    return parse_json(response.content)
+
+
 def _parse_vuln(
     vuln: dict[str, Any],
     package: str,
@@ -105,11 +195,6 @@ def _parse_datetime(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
     try:
-        if value.endswith("Z"):
-            value = value[:-1] + "+00:00"
-        parsed = datetime.fromisoformat(value)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed
+        return parse_iso_timestamp(value)
     except ValueError:
         return datetime.now(timezone.utc)
@@ -1,47 +1,77 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import asyncio
 from email.utils import parsedate_to_datetime
 import logging
-from typing import Any
-import xml.etree.ElementTree as ET
+from typing import Any, Iterator
+from urllib.parse import urlsplit
 
 import httpx
 
-from .base import BaseFeed, FeedItem
+try:
+    from lxml import etree as ET
 
+    _LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
 
-@dataclass
+    _LXML = False
+
+from .base import BaseFeed, FeedItem, parse_iso_timestamp
+
+
+RSS_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.8"
+RSS_CONCURRENCY = 32
+RSS_HOST_CONCURRENCY = 4
+RSS_STALE_LIMIT = 3
+
+
+@dataclass(frozen=True, slots=True)
 class RSSSource:
     name: str
     url: str
+    # Opt-in: the feed is known to list entries newest first, so a run of
+    # stale entries ends the download early.
+    newest_first: bool = False
+    name_lower: str = field(init=False, repr=False, compare=False)
+    id_prefix: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_lower", self.name.lower())
+        object.__setattr__(self, "id_prefix", f"rss:{self.name}:")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RSSSettings:
     sources: list[RSSSource]
-    timeout_seconds: int
     user_agent: str
+    # Shared with State.http_cache so validators persist between polls.
+    http_cache: dict[str, dict[str, str]] = field(default_factory=dict)
 
 
 class RSSFeed(BaseFeed):
-    def __init__(self, settings: RSSSettings) -> None:
+    def __init__(self, settings: RSSSettings, client: httpx.AsyncClient) -> None:
         self._settings = settings
+        self._client = client
         self._logger = logging.getLogger(__name__)
+        self._semaphore = asyncio.Semaphore(RSS_CONCURRENCY)
+        self._host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(RSS_HOST_CONCURRENCY)
+        )
 
     async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
         if not self._settings.sources:
             return []
         start = since or (datetime.now(timezone.utc) - timedelta(days=1))
-        headers = {"User-Agent": self._settings.user_agent}
+        # Accept-Encoding is left to httpx, which only advertises the codecs
+        # it can decode (br/zstd appear once brotli/zstandard are installed).
+        headers = {"User-Agent": self._settings.user_agent, "Accept": RSS_ACCEPT}
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            tasks = [
-                _fetch_source(client, source, headers, start) for source in self._settings.sources
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [self._fetch_limited(source, headers, start) for source in self._settings.sources]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         items: list[FeedItem] = []
         for result in results:
@@ -51,83 +81,155 @@ class RSSFeed(BaseFeed):
             items.extend(result)
         return items
 
+    async def _fetch_limited(
+        self,
+        source: RSSSource,
+        headers: dict[str, str],
+        since: datetime,
+    ) -> list[FeedItem]:
+        # Take the per-host slot first so sources queued behind a busy host
+        # do not hold global slots while they wait.
+        async with self._host_semaphores[urlsplit(source.url).netloc], self._semaphore:
+            return await _fetch_source(self._client, source, headers, since, self._settings.http_cache)
+
 
 async def _fetch_source(
     client: httpx.AsyncClient,
     source: RSSSource,
     headers: dict[str, str],
     since: datetime,
+    http_cache: dict[str, dict[str, str]],
 ) -> list[FeedItem]:
-    response = await client.get(source.url, headers=headers)
-    response.raise_for_status()
-    return _parse_feed(source, response.text, since)
-
+    validators = http_cache.get(source.url, {})
+    request_headers = dict(headers)
+    if "etag" in validators:
+        request_headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        request_headers["If-Modified-Since"] = validators["last_modified"]
 
-def _parse_feed(source: RSSSource, payload: str, since: datetime) -> list[FeedItem]:
-    root = ET.fromstring(payload)
-    tag = _strip_namespace(root.tag)
-    if tag == "rss":
-        return _parse_rss_channel(source, root, since)
-    if tag == "feed":
-        return _parse_atom_feed(source, root, since)
-    return []
+    async with client.stream("GET", source.url, headers=request_headers) as response:
+        if response.status_code == 304:
+            return []
+        response.raise_for_status()
+        items = await _read_items(response, source, since)
+    # Only a body that was read and parsed may be revalidated next poll;
+    # otherwise a 304 would hide items that were never processed.
+    _remember_validators(http_cache, source.url, response.headers)
+    return items
 
 
-def _parse_rss_channel(source: RSSSource, root: ET.Element, since: datetime) -> list[FeedItem]:
-    channel = root.find("channel")
-    if channel is None:
-        return []
+async def _read_items(response: httpx.Response, source: RSSSource, since: datetime) -> list[FeedItem]:
+    # For feeds declared newest first, a run of stale entries means the rest
+    # of the document is stale too and need not be downloaded.
+    parser = _pull_parser()
     items: list[FeedItem] = []
-    for item in channel.findall("item"):
-        title = _text(item, "title") or source.name
-        description = _text(item, "description") or ""
-        link = _text(item, "link") or ""
-        guid = _text(item, "guid") or link or title
-        published = _parse_pubdate(_text(item, "pubDate"))
-        if published < since:
-            continue
-        items.append(
-            FeedItem(
-                id=f"rss:{source.name}:{guid}",
-                source=source.name.lower(),
-                title=title,
-                description=description,
-                url=link,
-                published=published,
-                severity=None,
-                cvss_score=None,
-                affected_packages=[],
-                raw_data={},
-            )
-        )
+    stale = 0
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+        for item in _drain(source, parser):
+            if item.published >= since:
+                items.append(item)
+                stale = 0
+                continue
+            stale += 1
+            if source.newest_first and stale >= RSS_STALE_LIMIT:
+                logging.getLogger(__name__).debug(
+                    "RSS %s: stopped after %s stale entries", source.name, stale
+                )
+                return items
+    parser.close()
+    items.extend(item for item in _drain(source, parser) if item.published >= since)
     return items
 
 
-def _parse_atom_feed(source: RSSSource, root: ET.Element, since: datetime) -> list[FeedItem]:
-    items: list[FeedItem] = []
-    for entry in root.findall("{*}entry"):
-        title = _text(entry, "title") or source.name
-        description = _text(entry, "summary") or _text(entry, "content") or ""
-        link = _atom_link(entry)
-        entry_id = _text(entry, "id") or link or title
-        published = _parse_pubdate(_text(entry, "updated") or _text(entry, "published"))
-        if published < since:
-            continue
-        items.append(
-            FeedItem(
-                id=f"rss:{source.name}:{entry_id}",
-                source=source.name.lower(),
-                title=title,
-                description=description,
-                url=link,
-                published=published,
-                severity=None,
-                cvss_score=None,
-                affected_packages=[],
-                raw_data={},
-            )
+def _remember_validators(
+    http_cache: dict[str, dict[str, str]],
+    url: str,
+    headers: httpx.Headers,
+) -> None:
+    fresh = {
+        key: value
+        for key, value in (("etag", headers.get("ETag")), ("last_modified", headers.get("Last-Modified")))
+        if value
+    }
+    if fresh:
+        http_cache[url] = fresh
+    else:
+        http_cache.pop(url, None)
+
+
+def _parse_feed(source: RSSSource, payload: bytes, since: datetime) -> list[FeedItem]:
+    parser = _pull_parser()
+    parser.feed(payload)
+    parser.close()
+    return [item for item in _drain(source, parser) if item.published >= since]
+
+
+def _pull_parser() -> Any:
+    if _LXML:
+        return ET.XMLPullParser(
+            events=("end",),
+            tag=("{*}item", "{*}entry"),
+            resolve_entities=False,
+            no_network=True,
+            recover=True,
         )
-    return items
+    return ET.XMLPullParser(events=("end",))
+
+
+def _drain(source: RSSSource, parser: Any) -> Iterator[FeedItem]:
+    for _, element in parser.read_events():
+        tag = _strip_namespace(element.tag)
+        if tag == "item":
+            yield _parse_rss_item(source, element)
+        elif tag == "entry":
+            yield _parse_atom_entry(source, element)
+        else:
+            continue
+        element.clear()
+        if _LXML:
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def _parse_rss_item(source: RSSSource, item: ET.Element) -> FeedItem:
+    children = _children(item)
+    title = _text(children, "title") or source.name
+    description = _text(children, "description") or ""
+    link = _text(children, "link") or ""
+    guid = _text(children, "guid") or link or title
+    return FeedItem(
+        id=source.id_prefix + guid,
+        source=source.name_lower,
+        title=title,
+        description=description,
+        url=link,
+        published=_parse_pubdate(_text(children, "pubDate")),
+        severity=None,
+        cvss_score=None,
+        affected_packages=[],
+        raw_data={},
+    )
+
+
+def _parse_atom_entry(source: RSSSource, entry: ET.Element) -> FeedItem:
+    children = _children(entry)
+    title = _text(children, "title") or source.name
+    description = _text(children, "summary") or _text(children, "content") or ""
+    link = _atom_link(entry)
+    entry_id = _text(children, "id") or link or title
+    return FeedItem(
+        id=source.id_prefix + entry_id,
+        source=source.name_lower,
+        title=title,
+        description=description,
+        url=link,
+        published=_parse_pubdate(_text(children, "updated") or _text(children, "published")),
+        severity=None,
+        cvss_score=None,
+        affected_packages=[],
+        raw_data={},
+    )
 
 
 def _atom_link(entry: ET.Element) -> str:
@@ -142,18 +244,39 @@ def _parse_pubdate(value: str | None) -> datetime:
     if not value:
         return datetime.now(timezone.utc)
     try:
-        parsed = parsedate_to_datetime(value)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
+        return _parse_timestamp(value)
     except (TypeError, ValueError):
         return datetime.now(timezone.utc)
 
 
-def _text(node: ET.Element, tag: str) -> str | None:
-    child = node.find(tag)
-    if child is None:
-        child = node.find(f"{{*}}{tag}")
+def _parse_timestamp(value: str) -> datetime:
+    # Atom dates are ISO 8601 (leading year); RSS pubDate is RFC 822.
+    if value[:4].isdigit():
+        return parse_iso_timestamp(value)
+    parsed = parsedate_to_datetime(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _children(node: ET.Element) -> dict[str, ET.Element]:
+    """Map local tag names to the first matching child, preferring un-namespaced tags."""
+    plain: dict[str, ET.Element] = {}
+    namespaced: dict[str, ET.Element] = {}
+    for child in node:
+        tag = child.tag
+        if not isinstance(tag, str):
+            continue
+        if "}" in tag:
+            namespaced.setdefault(tag.split("}", 1)[1], child)
+        else:
+            plain.setdefault(tag, child)
+    namespaced.update(plain)
+    return namespaced
+
+
+def _text(children: dict[str, ET.Element], tag: str) -> str | None:
+    child = children.get(tag)
     if child is None or child.text is None:
         return None
     return child.text.strip()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+import httpx
+
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def build_http_client(
+    timeout_seconds: float,
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+) -> httpx.AsyncClient:
+    """Build a pooled client meant to be shared and closed by its owner."""
+    return httpx.AsyncClient(
+        timeout=timeout_seconds,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_json(payload: Any, sort_keys: bool = False) -> bytes:
+    """Serialize payload to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(payload, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+
+
+def parse_json(payload: bytes | str) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
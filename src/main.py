@@ -8,12 +8,22 @@ from __future__ import annotations
 import argparse
 import asyncio
 from datetime import datetime, timezone
+from itertools import chain
 import logging
+from operator import attrgetter
 from pathlib import Path
+import sys
+import time
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from .config import load_config
 from .dependencies import DependenciesConfig, DependencySource, load_dependency_graph
 from .decisions import classify_alert
+from .feeds.base import FeedItem
 from .feeds.cisa import CISAFeed, CISASettings
 from .feeds.github import GitHubFeed, GitHubSettings
 from .feeds.hackernews import HackerNewsFeed, HackerNewsSettings
@@ -21,12 +31,17 @@ from .feeds.msrc import MSRCFeed, MSRCSettings
 from .feeds.nvd import NVDFeed, NVDSettings
 from .feeds.osv import OSVFeed, OSVSettings
 from .feeds.rss import RSSFeed, RSSSettings, RSSSource
-from .matcher import calculate_relevance
-from .notifiers.factory import build_notifiers, build_notification_message
-from .state import load_state, mark_sent, prune_sent, save_state, was_sent
+from .http_clients import build_http_client
+from .matcher import calculate_relevance, prepare_stack
+from .notifiers.factory import build_notifiers, build_notification_message, dispatch_all
+from .state import load_state, mark_sent, prune_sent, save_state
 from .scoring import score_alert
 
 
+_PRIORITY_ORDER = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+NOTIFY_CONCURRENCY = 4
+
+
 async def main() -> None:
     args = _parse_args()
     _configure_logging(args.verbose)
@@ -45,11 +60,7 @@ async def main() -> None:
     else:
         logger.info("always_page keywords: none")
 
-    state = load_state(config.settings.state_file)
-
-    feeds = _build_feeds(config)
     notifiers = build_notifiers(config)
-    dependency_graph = _build_dependency_graph(config, Path(args.config))
     if not args.dry_run and not notifiers:
         raise SystemExit(
             "At least one notifier is required unless --dry-run is set. "
@@ -62,23 +73,35 @@ async def main() -> None:
         message, metadata = build_notification_message(
             _build_test_item(), ["Test notification"], None, None
         )
-        for notifier in notifiers:
-            await notifier.send(message, metadata)
+        try:
+            for result in await dispatch_all(notifiers, message, metadata):
+                if isinstance(result, BaseException):
+                    raise result
+        finally:
+            await _close_notifiers(notifiers)
         return
 
-    while True:
-        await _poll_once(
-            feeds,
-            notifiers,
-            config,
-            state,
-            dependency_graph,
-            dry_run=args.dry_run,
-        )
-        save_state(config.settings.state_file, state)
-        if args.once:
-            break
-        await asyncio.sleep(config.settings.poll_interval_minutes * 60)
+    state = load_state(config.settings.state_file)
+    dependency_graph = _build_dependency_graph(config, Path(args.config))
+    feed_client = build_http_client(config.settings.request_timeout_seconds)
+    feeds = _build_feeds(config, feed_client, state)
+    try:
+        while True:
+            await _poll_once(
+                feeds,
+                notifiers,
+                config,
+                state,
+                dependency_graph,
+                dry_run=args.dry_run,
+            )
+            save_state(config.settings.state_file, state)
+            if args.once:
+                break
+            await asyncio.sleep(config.settings.poll_interval_minutes * 60)
+    finally:
+        await feed_client.aclose()
+        await _close_notifiers(notifiers)
 
 
 def _parse_args() -> argparse.Namespace:
@@ -97,7 +120,7 @@ def _configure_logging(verbose: bool) -> None:
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(message)s")
 
 
-def _build_feeds(config):
+def _build_feeds(config, client, state):
     settings = config.settings
     feeds = []
 
@@ -106,9 +129,9 @@ def _build_feeds(config):
             NVDFeed(
                 NVDSettings(
                     max_results=settings.max_results_per_feed,
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
@@ -118,9 +141,9 @@ def _build_feeds(config):
                 GitHubSettings(
                     ecosystems=list(config.stack.packages.keys()),
                     max_results=settings.max_results_per_feed,
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
@@ -128,9 +151,9 @@ def _build_feeds(config):
         feeds.append(
             MSRCFeed(
                 MSRCSettings(
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
@@ -138,9 +161,9 @@ def _build_feeds(config):
         feeds.append(
             CISAFeed(
                 CISASettings(
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
@@ -150,21 +173,24 @@ def _build_feeds(config):
                 OSVSettings(
                     packages=config.stack.packages,
                     max_results=settings.max_results_per_feed,
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
     if config.feeds.rss:
-        sources = [RSSSource(name=item.name, url=item.url) for item in config.feeds.rss]
+        sources = [
+            RSSSource(name=item.name, url=item.url, newest_first=item.newest_first) for item in config.feeds.rss
+        ]
         feeds.append(
             RSSFeed(
                 RSSSettings(
                     sources=sources,
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                    http_cache=state.http_cache,
+                ),
+                client,
             )
         )
 
@@ -175,9 +201,9 @@ def _build_feeds(config):
                 HackerNewsSettings(
                     terms=terms,
                     max_results=settings.max_results_per_feed,
-                    timeout_seconds=settings.request_timeout_seconds,
                     user_agent=settings.user_agent,
-                )
+                ),
+                client,
             )
         )
 
@@ -196,13 +222,13 @@ def _init_config(target: Path) -> None:
 
 
 def _build_hn_terms(config, max_terms: int) -> list[str]:
-    terms: list[str] = []
-    candidates = (
-        config.stack.keywords
-        + config.stack.services
-        + config.stack.cloud
-        + [pkg for packages in config.stack.packages.values() for pkg in packages]
-        + config.stack.languages
+    terms: dict[str, None] = {}
+    candidates = chain(
+        config.stack.keywords,
+        config.stack.services,
+        config.stack.cloud,
+        chain.from_iterable(config.stack.packages.values()),
+        config.stack.languages,
     )
     for term in candidates:
         cleaned = term.strip()
@@ -211,10 +237,10 @@ def _build_hn_terms(config, max_terms: int) -> list[str]:
         lowered = cleaned.lower()
         if lowered in terms:
             continue
-        terms.append(lowered)
+        terms[lowered] = None
         if len(terms) >= max_terms:
             break
-    return terms
+    return list(terms)
 
 
 def _build_dependency_graph(config, config_path: Path):
@@ -236,30 +262,60 @@ async def _poll_once(feeds, notifiers, config, state, dependencies, dry_run: boo
     logger = logging.getLogger(__name__)
     since = state.last_poll
 
-    tasks = [feed.fetch_recent(since=since) for feed in feeds]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    timeout = config.settings.feed_timeout_seconds
+    async with asyncio.TaskGroup() as group:
+        tasks = [group.create_task(_fetch_feed(feed, since, timeout)) for feed in feeds]
+    results = [task.result() for task in tasks]
 
-    items = []
+    # The same id can come back more than once (e.g. one OSV advisory per
+    # affected package); keep the highest-CVSS copy with the packages merged.
+    # Copies from different ecosystems stay apart so packages are only ever
+    # matched against their own ecosystem.
+    unique: dict[tuple[str, frozenset[str]], FeedItem] = {}
     for feed_result in results:
-        if isinstance(feed_result, Exception):
-            logger.error("Feed fetch failed: %s", feed_result)
-            continue
-        items.extend(feed_result)
+        for item in feed_result:
+            # Normalize once so the sorts below compare plain datetimes.
+            if item.published.tzinfo is None:
+                item.published = item.published.replace(tzinfo=timezone.utc)
+            key = (item.id, frozenset(item.ecosystems))
+            previous = unique.get(key)
+            if previous is None:
+                unique[key] = item
+                continue
+            keep, other = previous, item
+            if _cvss_or_floor(item) > _cvss_or_floor(previous):
+                keep, other = item, previous
+            keep.affected_packages = list(dict.fromkeys(keep.affected_packages + other.affected_packages))
+            unique[key] = keep
+    # Run the cheap gates (already sent, CVSS floor) before the sort so only
+    # surviving items reach sorting and relevance matching.
+    sent_items = state.sent_items
+    cvss_floor = _cvss_floor(config.settings)
+    items = sorted(
+        (
+            item
+            for (item_id, _), item in unique.items()
+            if item_id not in sent_items
+            and (cvss_floor is None or item.cvss_score is None or item.cvss_score >= cvss_floor)
+        ),
+        key=attrgetter("published"),
+    )
 
+    stack = config.stack
     matched_count = 0
     notified_count = 0
     candidates = []
-    for item in sorted(items, key=lambda x: _normalize_dt(x.published)):
-        if was_sent(state, item.id):
+    prepared = prepare_stack(stack, dependencies)
+    scored_at = time.time()
+    # Per-ecosystem copies share an id; only the first relevant one alerts.
+    matched_ids: set[str] = set()
+    for item in items:
+        if item.id in matched_ids:
             continue
-        if not config.settings.include_low_severity and _is_low_severity(item):
-            continue
-        if _below_min_cvss(item, config.settings.min_cvss_score):
-            continue
-
-        match = calculate_relevance(item, config.stack, dependencies)
+        match = calculate_relevance(item, stack, dependencies, prepared)
         if not match.is_relevant:
             continue
+        matched_ids.add(item.id)
 
         matched_count += 1
         if dry_run:
@@ -267,7 +323,7 @@ async def _poll_once(feeds, notifiers, config, state, dependencies, dry_run: boo
             mark_sent(state, item.id)
             continue
 
-        score = score_alert(item, match, config.scoring, config.stack)
+        score = score_alert(item, match, config.scoring, stack, now=scored_at)
         message, metadata = build_notification_message(item, match.reasons, match, score)
         decision = classify_alert(
             item,
@@ -284,40 +340,34 @@ async def _poll_once(feeds, notifiers, config, state, dependencies, dry_run: boo
         digest = [entry for entry in candidates if not entry[3].immediate]
 
         immediate.sort(key=lambda entry: _priority_sort(entry[0].priority, entry[0].published))
-        for message, metadata, item, decision in immediate:
-            if not notifiers:
+        if not notifiers:
+            for _, _, item, _ in immediate:
                 logger.warning("No notifier configured; skipping %s", item.id)
-                continue
-            logger.info("Why this alerted: %s", decision.reason)
-            sent = True
-            for notifier in notifiers:
-                try:
-                    success = await notifier.send(message, metadata)
-                except Exception as exc:
-                    logger.error("Notifier failed for %s: %s", item.id, exc)
-                    success = False
-                sent = sent and success
-            if sent:
-                logger.info("Notified for %s", item.id)
-                mark_sent(state, item.id)
-                notified_count += 1
-                if notified_count >= config.settings.max_notifications_per_run:
-                    logger.warning(
-                        "Reached max_notifications_per_run=%s; stopping early",
-                        config.settings.max_notifications_per_run,
-                    )
-                    break
+            immediate = []
+        # Send in waves no larger than the remaining budget so failed sends
+        # still let later alerts through, as the sequential loop did.
+        limit = config.settings.max_notifications_per_run
+        semaphore = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+        while immediate and notified_count < limit:
+            wave, immediate = immediate[: limit - notified_count], immediate[limit - notified_count :]
+            for _, _, _, decision in wave:
+                logger.info("Why this alerted: %s", decision.reason)
+            results = await asyncio.gather(*(_send_alerts(notifier, wave, semaphore) for notifier in notifiers))
+            for (_, _, item, _), *delivered in zip(wave, *results):
+                if all(delivered):
+                    logger.info("Notified for %s", item.id)
+                    mark_sent(state, item.id)
+                    notified_count += 1
+            if notified_count >= limit:
+                logger.warning("Reached max_notifications_per_run=%s; stopping early", limit)
 
         if digest:
             digest_message, digest_metadata = _build_digest_message(digest, config.mode)
             digest_sent = True
-            for notifier in notifiers:
-                try:
-                    success = await notifier.send(digest_message, digest_metadata)
-                except Exception as exc:
-                    logger.error("Digest notifier failed: %s", exc)
-                    success = False
-                digest_sent = digest_sent and success
+            for result in await dispatch_all(notifiers, digest_message, digest_metadata):
+                if isinstance(result, BaseException):
+                    logger.error("Digest notifier failed: %s", result)
+                digest_sent = digest_sent and result is True
             if digest_sent:
                 logger.info("Sent digest for %s alerts", len(digest))
                 for _, _, item, _ in digest:
@@ -331,27 +381,62 @@ async def _poll_once(feeds, notifiers, config, state, dependencies, dry_run: boo
         logger.info("Poll complete: %s matches, %s notified", matched_count, notified_count)
 
 
-def _is_low_severity(item) -> bool:
-    if item.cvss_score is None:
-        return False
-    return item.cvss_score < 4.0
+async def _send_alerts(notifier, wave, semaphore: asyncio.Semaphore) -> list[bool]:
+    """Deliver a wave through one notifier, batching when it supports it; returns per-alert success."""
+    size = notifier.max_batch_size
+    batches = [wave[offset : offset + size] for offset in range(0, len(wave), size)]
+    results = await asyncio.gather(*(_send_batch(notifier, batch, semaphore) for batch in batches))
+    return [sent for batch, sent in zip(batches, results) for _ in batch]
+
+
+async def _send_batch(notifier, batch, semaphore: asyncio.Semaphore) -> bool:
+    async with semaphore:
+        try:
+            if len(batch) == 1:
+                message, metadata, _, _ = batch[0]
+                return await notifier.send(message, metadata)
+            return await notifier.send_batch([(message, metadata) for message, metadata, _, _ in batch])
+        except Exception as exc:
+            item_ids = ", ".join(item.id for _, _, item, _ in batch)
+            logging.getLogger(__name__).error("Notifier failed for %s: %s", item_ids, exc)
+            return False
+
+
+async def _close_notifiers(notifiers) -> None:
+    for notifier in notifiers:
+        await notifier.aclose()
+
+
+async def _fetch_feed(feed, since: datetime | None, timeout: float) -> list[FeedItem]:
+    # Failures are contained here so one feed never cancels the TaskGroup.
+    try:
+        async with asyncio.timeout(timeout):
+            return await feed.fetch_recent(since=since)
+    except TimeoutError:
+        logging.getLogger(__name__).error(
+            "Feed fetch timed out after %ss: %s", timeout, type(feed).__name__
+        )
+    except Exception as exc:
+        # Feeds that fan out through a TaskGroup raise an ExceptionGroup.
+        errors = exc.exceptions if isinstance(exc, ExceptionGroup) else (exc,)
+        logging.getLogger(__name__).error("Feed fetch failed: %s", "; ".join(str(error) for error in errors))
+    return []
 
 
-def _below_min_cvss(item, min_score: float | None) -> bool:
-    if min_score is None or item.cvss_score is None:
-        return False
-    return item.cvss_score < min_score
+def _cvss_floor(settings) -> float | None:
+    # Items without a CVSS score always pass; low severity means below 4.0.
+    floors = [] if settings.include_low_severity else [4.0]
+    if settings.min_cvss_score is not None:
+        floors.append(settings.min_cvss_score)
+    return max(floors, default=None)
 
 
-def _normalize_dt(value: datetime) -> datetime:
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc)
-    return value
+def _cvss_or_floor(item: FeedItem) -> float:
+    return item.cvss_score if item.cvss_score is not None else -1.0
 
 
 def _priority_sort(priority: str, published: datetime) -> tuple[int, datetime]:
-    order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-    return (order.get(priority, 9), _normalize_dt(published))
+    return (_PRIORITY_ORDER.get(priority, 9), published)
 
 
 def _build_digest_message(entries, mode: str):
@@ -400,4 +485,7 @@ def _build_test_item():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None and sys.platform != "win32":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
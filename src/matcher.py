@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 import re
+import sys
 from typing import Iterable
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from .config import StackConfig
 from .dependencies.normalize import normalize_package_name
 from .dependencies.types import DependencyGraph
@@ -19,85 +27,175 @@ DEFAULT_SYNONYMS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchDetails:
-    direct_package_hits: set[str] = field(default_factory=set)
-    transitive_package_hits: set[str] = field(default_factory=set)
-    service_hits: set[str] = field(default_factory=set)
-    cloud_hits: set[str] = field(default_factory=set)
-    keyword_hits: set[str] = field(default_factory=set)
-    language_hits: set[str] = field(default_factory=set)
-    alias_hits: set[str] = field(default_factory=set)
+    direct_package_hits: frozenset[str] = frozenset()
+    transitive_package_hits: frozenset[str] = frozenset()
+    service_hits: frozenset[str] = frozenset()
+    cloud_hits: frozenset[str] = frozenset()
+    keyword_hits: frozenset[str] = frozenset()
+    language_hits: frozenset[str] = frozenset()
+    alias_hits: frozenset[str] = frozenset()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchResult:
     is_relevant: bool
     reasons: list[str]
     details: MatchDetails
 
 
+# Most items match nothing; they all share one empty details instance.
+_NO_DETAILS = MatchDetails()
+_TERM_FIELDS = {
+    "Service": "service_hits",
+    "Cloud": "cloud_hits",
+    "Keyword": "keyword_hits",
+    "Language": "language_hits",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedStack:
+    """Per-stack lookup tables that stay fixed across items."""
+
+    synonym_index: dict[str, str]
+    synonyms_by_canonical: dict[str, set[str]]
+    direct_packages: dict[str, set[str]]
+    transitive_packages: dict[str, set[str]]
+    # (configured value, lowercased token) pairs, lowered once per stack.
+    package_mentions: tuple[tuple[str, str], ...]
+    # (label, configured value, lowercased token) for services, clouds,
+    # keywords and languages, matched together in one pass.
+    terms: tuple[tuple[str, str, str], ...]
+    tokens: tuple[str, ...]
+    automaton: ahocorasick.Automaton | None
+
+
+def prepare_stack(config: StackConfig, dependencies: DependencyGraph) -> PreparedStack:
+    match_config = config.match
+    synonym_index, synonyms_by_canonical = _build_synonym_maps(config.synonyms, match_config.synonyms)
+    direct_packages, transitive_packages = _build_package_sets(config, dependencies, match_config.normalize_names)
+    tokens = _stack_tokens(config, direct_packages, synonyms_by_canonical)
+    return PreparedStack(
+        synonym_index=synonym_index,
+        synonyms_by_canonical=synonyms_by_canonical,
+        direct_packages=direct_packages,
+        transitive_packages=transitive_packages,
+        package_mentions=_lowered(pkg for packages in direct_packages.values() for pkg in packages),
+        terms=tuple(
+            (label, value, token)
+            for label, values in (
+                ("Service", config.services),
+                ("Cloud", config.cloud),
+                ("Keyword", config.keywords),
+                ("Language", config.languages),
+            )
+            for value, token in _lowered(values)
+        ),
+        tokens=tokens,
+        automaton=_token_automaton(tokens),
+    )
+
+
 def calculate_relevance(
     item: FeedItem,
     config: StackConfig,
     dependencies: DependencyGraph,
+    prepared: PreparedStack | None = None,
 ) -> MatchResult:
     """
     Returns MatchResult with reasons and detailed match signals.
+
+    Pass ``prepared`` (from prepare_stack) when matching many items against
+    the same stack.
     """
     reasons: list[str] = []
-    details = MatchDetails()
-    text = f"{item.title} {item.description}".lower()
+    found: defaultdict[str, set[str]] = defaultdict(set)
     match_config = config.match
-
-    synonym_index, synonyms_by_canonical = _build_synonym_maps(config.synonyms, match_config.synonyms)
-
-    direct_packages, transitive_packages = _build_package_sets(config, dependencies, match_config.normalize_names)
+    if prepared is None:
+        prepared = prepare_stack(config, dependencies)
+    synonym_index = prepared.synonym_index
+    synonyms_by_canonical = prepared.synonyms_by_canonical
+    direct_packages = prepared.direct_packages
+    transitive_packages = prepared.transitive_packages
+
+    hits = _find_tokens(item.text_lower, prepared.tokens, prepared.automaton)
+    # With no token in the text and no structured affected lists there is
+    # nothing left for the matchers to find.
+    if not hits and not (item.affected_packages or item.affected_services or item.affected_cloud):
+        return MatchResult(is_relevant=False, reasons=reasons, details=_NO_DETAILS)
 
     _match_packages(
         item,
-        text,
+        hits,
         match_config,
         synonym_index,
         synonyms_by_canonical,
         direct_packages,
         transitive_packages,
-        details,
-        reasons,
-    )
-    _match_services(
-        text,
-        item.affected_services,
-        config.services,
-        synonyms_by_canonical,
-        match_config,
-        details,
+        prepared.package_mentions,
+        found,
         reasons,
     )
-    _match_cloud(
-        text,
-        item.affected_cloud,
-        config.cloud,
-        synonyms_by_canonical,
-        match_config,
-        details,
-        reasons,
+    _match_terms(hits, item, prepared.terms, synonyms_by_canonical, match_config, found, reasons)
+
+    if not reasons:
+        return MatchResult(is_relevant=False, reasons=reasons, details=_NO_DETAILS)
+    details = MatchDetails(**{name: frozenset(values) for name, values in found.items()})
+    # Reasons are shown sorted in notifications; a set is the cheapest dedupe before sorting.
+    return MatchResult(is_relevant=True, reasons=sorted(set(reasons)), details=details)
+
+
+def _contains_token(hits: frozenset[str], token: str) -> bool:
+    return token.strip() in hits
+
+
+def _stack_tokens(
+    config: StackConfig,
+    direct_packages: dict[str, set[str]],
+    synonyms_by_canonical: dict[str, set[str]],
+) -> tuple[str, ...]:
+    tokens = {pkg.lower() for packages in direct_packages.values() for pkg in packages}
+    tokens.update(alias for aliases in synonyms_by_canonical.values() for alias in aliases)
+    for values in (config.services, config.cloud, config.keywords, config.languages):
+        tokens.update(value.lower() for value in values)
+    return tuple(sorted(sys.intern(token) for token in (token.strip() for token in tokens) if token))
+
+
+def _find_tokens(
+    text: str,
+    tokens: tuple[str, ...],
+    automaton: ahocorasick.Automaton | None,
+) -> frozenset[str]:
+    """Return the tokens that occur in text; short tokens must match on word boundaries."""
+    if automaton is None:
+        found = [token for token in tokens if token in text]
+    else:
+        found = {token for _, token in automaton.iter(text)}
+    return frozenset(
+        token for token in found if len(token) > 3 or _short_token_pattern(token).search(text)
     )
-    _match_keywords(text, config.keywords, details, reasons)
-    _match_languages(text, config.languages, details, reasons)
 
-    reasons = sorted(set(reasons))
-    return MatchResult(is_relevant=bool(reasons), reasons=reasons, details=details)
+
+def _token_automaton(tokens: tuple[str, ...]) -> ahocorasick.Automaton | None:
+    # One Aho-Corasick pass finds every (overlapping) token occurrence.
+    if ahocorasick is None or not tokens:
+        return None
+    automaton = ahocorasick.Automaton()
+    for token in tokens:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=4096)
+def _short_token_pattern(token: str) -> re.Pattern[str]:
+    return re.compile(_SHORT_TOKEN.pattern.format(re.escape(token)))
 
 
-def _contains_token(text: str, token: str) -> bool:
-    token = token.strip()
-    if not token:
-        return False
-    if len(token) <= 3:
-        pattern = _SHORT_TOKEN.pattern.format(re.escape(token))
-        return re.search(pattern, text) is not None
-    return token in text
+def _lowered(values: Iterable[str]) -> tuple[tuple[str, str], ...]:
+    return tuple((value, sys.intern(value.lower())) for value in values)
 
 
 def _lower_set(values: Iterable[str]) -> set[str]:
@@ -125,11 +223,11 @@ def _register_aliases(
     canonical: str,
     aliases: Iterable[str],
 ) -> None:
-    canonical_norm = canonical.strip().lower()
+    canonical_norm = sys.intern(canonical.strip().lower())
     if not canonical_norm:
         return
     for alias in aliases:
-        alias_norm = alias.strip().lower()
+        alias_norm = sys.intern(alias.strip().lower())
         if alias_norm:
             alias_to_canonical[alias_norm] = canonical_norm
             canonical_to_aliases.setdefault(canonical_norm, set()).add(alias_norm)
@@ -144,21 +242,21 @@ def _build_package_sets(
     transitive: dict[str, set[str]] = {}
 
     for ecosystem, packages in config.packages.items():
-        eco = ecosystem.lower()
+        eco = sys.intern(ecosystem.lower())
         direct.setdefault(eco, set()).update(
-            normalize_package_name(pkg, eco, normalize_names) for pkg in packages
+            sys.intern(normalize_package_name(pkg, eco, normalize_names)) for pkg in packages
         )
 
     for ecosystem, packages in dependencies.direct.items():
-        eco = ecosystem.lower()
+        eco = sys.intern(ecosystem.lower())
         direct.setdefault(eco, set()).update(
-            normalize_package_name(pkg, eco, normalize_names) for pkg in packages
+            sys.intern(normalize_package_name(pkg, eco, normalize_names)) for pkg in packages
         )
 
     for ecosystem, packages in dependencies.transitive.items():
-        eco = ecosystem.lower()
+        eco = sys.intern(ecosystem.lower())
         transitive.setdefault(eco, set()).update(
-            normalize_package_name(pkg, eco, normalize_names) for pkg in packages
+            sys.intern(normalize_package_name(pkg, eco, normalize_names)) for pkg in packages
         )
 
     return direct, transitive
@@ -166,24 +264,24 @@ def _build_package_sets(
 
 def _match_packages(
     item: FeedItem,
-    text: str,
+    hits: frozenset[str],
     match_config,
     synonym_index: dict[str, str],
     synonyms_by_canonical: dict[str, set[str]],
     direct_packages: dict[str, set[str]],
     transitive_packages: dict[str, set[str]],
-    details: MatchDetails,
+    package_mentions: tuple[tuple[str, str], ...],
+    found: defaultdict[str, set[str]],
     reasons: list[str],
 ) -> None:
     if not item.affected_packages:
         _match_package_mentions(
-            text,
+            hits,
             match_config,
-            synonym_index,
             synonyms_by_canonical,
-            direct_packages,
+            package_mentions,
             reasons,
-            details,
+            found,
         )
         return
 
@@ -198,122 +296,70 @@ def _match_packages(
         for pkg in item.affected_packages:
             normalized = normalize_package_name(pkg, ecosystem, match_config.normalize_names)
             if normalized in direct_packages.get(ecosystem, set()):
-                details.direct_package_hits.add(normalized)
+                found["direct_package_hits"].add(normalized)
                 reasons.append(f"Direct package match: {pkg}")
                 continue
             if match_config.mode == "loose":
                 alias = synonym_index.get(normalized)
                 if alias and alias in direct_packages.get(ecosystem, set()):
-                    details.alias_hits.add(normalized)
+                    found["alias_hits"].add(normalized)
                     reasons.append(f"Package alias match: {pkg} -> {alias}")
                     continue
             if normalized in transitive_packages.get(ecosystem, set()):
-                details.transitive_package_hits.add(normalized)
+                found["transitive_package_hits"].add(normalized)
                 reasons.append(f"Transitive package match: {pkg}")
                 continue
             if match_config.mode == "loose":
                 alias = synonym_index.get(normalized)
                 if alias and alias in transitive_packages.get(ecosystem, set()):
-                    details.alias_hits.add(normalized)
+                    found["alias_hits"].add(normalized)
                     reasons.append(f"Transitive alias match: {pkg} -> {alias}")
 
 
 def _match_package_mentions(
-    text: str,
+    hits: frozenset[str],
     match_config,
-    synonym_index: dict[str, str],
     synonyms_by_canonical: dict[str, set[str]],
-    direct_packages: dict[str, set[str]],
+    package_mentions: tuple[tuple[str, str], ...],
     reasons: list[str],
-    details: MatchDetails,
+    found: defaultdict[str, set[str]],
 ) -> None:
-    for ecosystem, packages in direct_packages.items():
-        for pkg in packages:
-            token = pkg.lower()
-            if _contains_token(text, token):
-                details.direct_package_hits.add(token)
-                reasons.append(f"Package mentioned: {pkg}")
-                continue
-            if match_config.mode == "loose":
-                aliases = synonyms_by_canonical.get(token, set())
-                for alias in aliases:
-                    if _contains_token(text, alias):
-                        details.alias_hits.add(token)
-                        reasons.append(f"Package alias mention: {alias} -> {token}")
-                        break
-
-
-def _match_services(
-    text: str,
-    affected: Iterable[str],
-    services: list[str],
-    synonyms_by_canonical: dict[str, set[str]],
-    match_config,
-    details: MatchDetails,
-    reasons: list[str],
-) -> None:
-    affected_set = _lower_set(affected)
-    for service in services:
-        token = service.lower()
-        if token in affected_set or _contains_token(text, token):
-            details.service_hits.add(token)
-            reasons.append(f"Service match: {service}")
+    for pkg, token in package_mentions:
+        if _contains_token(hits, token):
+            found["direct_package_hits"].add(token)
+            reasons.append(f"Package mentioned: {pkg}")
             continue
         if match_config.mode == "loose":
             aliases = synonyms_by_canonical.get(token, set())
             for alias in aliases:
-                if alias in affected_set or _contains_token(text, alias):
-                    details.service_hits.add(token)
-                    reasons.append(f"Service alias match: {alias} -> {service}")
+                if _contains_token(hits, alias):
+                    found["alias_hits"].add(token)
+                    reasons.append(f"Package alias mention: {alias} -> {token}")
                     break
 
 
-def _match_cloud(
-    text: str,
-    affected: Iterable[str],
-    clouds: list[str],
+def _match_terms(
+    hits: frozenset[str],
+    item: FeedItem,
+    terms: tuple[tuple[str, str, str], ...],
     synonyms_by_canonical: dict[str, set[str]],
     match_config,
-    details: MatchDetails,
+    found: defaultdict[str, set[str]],
     reasons: list[str],
 ) -> None:
-    affected_set = _lower_set(affected)
-    for provider in clouds:
-        token = provider.lower()
-        if token in affected_set or _contains_token(text, token):
-            details.cloud_hits.add(token)
-            reasons.append(f"Cloud match: {provider}")
+    # Services and clouds also match the item's affected lists and aliases;
+    # keywords and languages only match the text.
+    affected = {"Service": _lower_set(item.affected_services), "Cloud": _lower_set(item.affected_cloud)}
+    loose = match_config.mode == "loose"
+    for label, value, token in terms:
+        affected_set = affected.get(label)
+        if _contains_token(hits, token) or (affected_set and token in affected_set):
+            found[_TERM_FIELDS[label]].add(token)
+            reasons.append(f"{label} match: {value}")
             continue
-        if match_config.mode == "loose":
-            aliases = synonyms_by_canonical.get(token, set())
-            for alias in aliases:
-                if alias in affected_set or _contains_token(text, alias):
-                    details.cloud_hits.add(token)
-                    reasons.append(f"Cloud alias match: {alias} -> {provider}")
+        if loose and affected_set is not None:
+            for alias in synonyms_by_canonical.get(token, ()):
+                if alias in affected_set or _contains_token(hits, alias):
+                    found[_TERM_FIELDS[label]].add(token)
+                    reasons.append(f"{label} alias match: {alias} -> {value}")
                     break
-
-
-def _match_keywords(
-    text: str,
-    keywords: list[str],
-    details: MatchDetails,
-    reasons: list[str],
-) -> None:
-    for keyword in keywords:
-        token = keyword.lower()
-        if _contains_token(text, token):
-            details.keyword_hits.add(token)
-            reasons.append(f"Keyword match: {keyword}")
-
-
-def _match_languages(
-    text: str,
-    languages: list[str],
-    details: MatchDetails,
-    reasons: list[str],
-) -> None:
-    for language in languages:
-        token = language.lower()
-        if _contains_token(text, token):
-            details.language_hits.add(token)
-            reasons.append(f"Language match: {language}")
@@ -1,12 +1,63 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import random
 
+import httpx
+
+from ..http_clients import build_http_client
 from .message import NotificationMessage, NotificationMetadata
 
 
+SEND_ATTEMPTS = 3
+RETRY_JITTER_SECONDS = 0.25
+# Upper bound on a server-supplied Retry-After so a bad header can't stall a send.
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
 class BaseNotifier(ABC):
+    _client: httpx.AsyncClient | None = None
+    # Notifiers that can deliver several alerts in one request raise this
+    # and override send_batch.
+    max_batch_size = 1
+
     @abstractmethod
     async def send(self, message: NotificationMessage, metadata: NotificationMetadata) -> bool:
         """Send notification. Returns True if successful."""
         raise NotImplementedError
+
+    async def send_batch(self, entries: list[tuple[NotificationMessage, NotificationMetadata]]) -> bool:
+        """Send up to max_batch_size notifications together. Returns True if all were delivered."""
+        results = [await self.send(message, metadata) for message, metadata in entries]
+        return all(results)
+
+    def _http_client(self, timeout_seconds: float) -> httpx.AsyncClient:
+        """Return this notifier's pooled client, creating it on first use."""
+        if self._client is None:
+            self._client = build_http_client(
+                timeout_seconds, max_connections=8, max_keepalive_connections=4
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def shorten(text: str, limit: int, suffix: str = "...") -> str:
+    """Truncate text to at most limit characters, marking the cut with suffix."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(suffix)] + suffix
+
+
+def backoff_delay(attempt: int, rng: random.Random) -> float:
+    """Full-jitter exponential backoff for retrying a failed send."""
+    return rng.uniform(0, min(30.0, 0.5 * 2**attempt))
+
+
+def rate_limit_delay(retry_after: float, attempt: int, rng: random.Random) -> float:
+    """Clamp a Retry-After delay and add jitter so concurrent senders don't wake together."""
+    delay = min(max(retry_after, 0.0), MAX_RETRY_AFTER_SECONDS)
+    return max(delay, rng.uniform(0, 2**attempt)) + rng.uniform(0, RETRY_JITTER_SECONDS)
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timezone
 import logging
+import random
 import asyncio
 import time
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
 
-from .base import BaseNotifier
+from ..json_codec import encode_json, parse_json
+from .base import SEND_ATTEMPTS, BaseNotifier, backoff_delay, rate_limit_delay, shorten
 from .message import NotificationMessage, NotificationMetadata
 
 
@@ -20,6 +21,11 @@ SEVERITY_COLORS = {
     "p3": 0x95A5A6,
 }
 
+_DESCRIPTION_LIMIT = 400
+# Discord rejects a message whose embeds carry more than this many characters
+# of title, description and field text combined.
+_EMBED_TEXT_LIMIT = 6000
+
 
 @dataclass
 class DiscordSettings:
@@ -29,52 +35,73 @@ class DiscordSettings:
 
 
 class DiscordNotifier(BaseNotifier):
+    # Discord accepts up to 10 embeds per webhook message; send_batch also
+    # splits by the combined text limit.
+    max_batch_size = 10
+
     def __init__(self, settings: DiscordSettings) -> None:
         self._settings = settings
         self._logger = logging.getLogger(__name__)
         self._last_sent_at = 0.0
+        self._throttle_lock = asyncio.Lock()
+        self._headers = {"User-Agent": settings.user_agent, "Content-Type": "application/json"}
+        self._rng = random.Random()
 
     async def send(self, message: NotificationMessage, metadata: NotificationMetadata) -> bool:
+        return await self.send_batch([(message, metadata)])
+
+    async def send_batch(self, entries: list[tuple[NotificationMessage, NotificationMetadata]]) -> bool:
+        embeds = [_build_embed(message, metadata) for message, metadata in entries]
+        results = [await self._post(batch) for batch in _pack_embeds(embeds)]
+        return all(results)
+
+    async def _post(self, embeds: list[dict[str, Any]]) -> bool:
         await self._throttle()
-        payload = _build_payload(message, metadata)
-        headers = {"User-Agent": self._settings.user_agent}
-
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            for attempt in range(3):
-                response = await client.post(self._settings.webhook_url, json=payload, headers=headers)
-                if response.status_code == 429:
-                    retry_after = _retry_after(response)
-                    self._logger.warning("Discord rate limit hit, sleeping %.2fs", retry_after)
-                    await asyncio.sleep(retry_after)
-                    continue
-                if 200 <= response.status_code < 300:
-                    return True
-                self._logger.error("Discord webhook failed with status %s", response.status_code)
-            return False
+        body = encode_json({"embeds": embeds})
+
+        client = self._http_client(self._settings.timeout_seconds)
+        for attempt in range(SEND_ATTEMPTS):
+            last_attempt = attempt == SEND_ATTEMPTS - 1
+            try:
+                response = await client.post(self._settings.webhook_url, content=body, headers=self._headers)
+            except httpx.TransportError as exc:
+                if last_attempt:
+                    raise
+                self._logger.warning("Discord webhook request failed, retrying: %s", exc)
+                await asyncio.sleep(backoff_delay(attempt, self._rng))
+                continue
+            if response.status_code == 429:
+                retry_after = rate_limit_delay(_retry_after(response), attempt, self._rng)
+                self._logger.warning("Discord rate limit hit, sleeping %.2fs", retry_after)
+                await asyncio.sleep(retry_after)
+                continue
+            if 200 <= response.status_code < 300:
+                return True
+            self._logger.error("Discord webhook failed with status %s", response.status_code)
+            # Client errors won't succeed on retry; back off on server errors.
+            if response.status_code < 500 or last_attempt:
+                return False
+            await asyncio.sleep(backoff_delay(attempt, self._rng))
+        return False
 
     async def _throttle(self) -> None:
         min_interval = 0.5
-        now = time.monotonic()
-        elapsed = now - self._last_sent_at
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
-        self._last_sent_at = time.monotonic()
+        # Concurrent sends queue here so the interval holds across them.
+        async with self._throttle_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_sent_at
+            if elapsed < min_interval:
+                await asyncio.sleep(min_interval - elapsed)
+            self._last_sent_at = time.monotonic()
 
 
-def _build_payload(message: NotificationMessage, metadata: NotificationMetadata) -> dict[str, Any]:
-    severity = message.priority.lower()
+def _build_embed(message: NotificationMessage, metadata: NotificationMetadata) -> dict[str, Any]:
+    severity = message.priority_key
     color = SEVERITY_COLORS.get(severity, SEVERITY_COLORS["p3"])
-    description = message.summary
-    if len(description) > 400:
-        description = description[:397] + "..."
 
     fields = [
-        {
-            "name": "Priority",
-            "value": f"{message.priority} ({message.score})",
-            "inline": True,
-        },
-        {"name": "Source", "value": message.source.upper(), "inline": True},
+        {"name": "Priority", "value": f"{message.priority} ({message.score})", "inline": True},
+        {"name": "Source", "value": message.source_label, "inline": True},
     ]
 
     if message.affected.get("packages"):
@@ -88,27 +115,45 @@ def _build_payload(message: NotificationMessage, metadata: NotificationMetadata)
     if metadata.rationale:
         fields.append({"name": "Scoring", "value": "\n".join(metadata.rationale[:2]), "inline": False})
 
-    timestamp = message.published.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
-
     return {
-        "embeds": [
-            {
-                "title": message.title,
-                "description": description,
-                "url": message.url,
-                "color": color,
-                "fields": fields,
-                "timestamp": timestamp,
-            }
-        ]
+        "title": message.title,
+        "description": shorten(message.summary, _DESCRIPTION_LIMIT),
+        "url": message.url,
+        "color": color,
+        "fields": fields,
+        "timestamp": message.published_iso,
     }
 
 
+def _pack_embeds(embeds: list[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    """Group embeds into messages that stay within Discord's embed count and text limits."""
+    batch: list[dict[str, Any]] = []
+    size = 0
+    for embed in embeds:
+        length = _embed_text_length(embed)
+        if batch and (len(batch) == DiscordNotifier.max_batch_size or size + length > _EMBED_TEXT_LIMIT):
+            yield batch
+            batch, size = [], 0
+        batch.append(embed)
+        size += length
+    if batch:
+        yield batch
+
+
+def _embed_text_length(embed: dict[str, Any]) -> int:
+    fields = embed.get("fields", ())
+    return (
+        len(embed.get("title") or "")
+        + len(embed.get("description") or "")
+        + sum(len(field["name"]) + len(field["value"]) for field in fields)
+    )
+
+
 def _retry_after(response: httpx.Response) -> float:
     value = response.headers.get("Retry-After") or response.headers.get("X-RateLimit-Reset-After")
     if not value:
         try:
-            data = response.json()
+            data = parse_json(response.content)
         except ValueError:
             return 1.0
         retry_after = data.get("retry_after")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -27,6 +28,18 @@ def build_notifiers(config: Config) -> list[BaseNotifier]:
     return notifiers
 
 
+async def dispatch_all(
+    notifiers: list[BaseNotifier],
+    message: NotificationMessage,
+    metadata: NotificationMetadata,
+) -> list[bool | BaseException]:
+    """Send one message through every notifier concurrently; failures are returned, not raised."""
+    return await asyncio.gather(
+        *(notifier.send(message, metadata) for notifier in notifiers),
+        return_exceptions=True,
+    )
+
+
 def _build_target(target_type: str, settings: dict[str, Any], config: Config) -> BaseNotifier | None:
     normalized = target_type.lower()
     if normalized == "slack":
@@ -87,9 +100,9 @@ def build_notification_message(
 ) -> tuple[NotificationMessage, NotificationMetadata]:
     summary = item.description or item.title
     affected = {
-        "packages": item.affected_packages,
-        "services": item.affected_services,
-        "cloud": item.affected_cloud,
+        "packages": _non_empty(item.affected_packages),
+        "services": _non_empty(item.affected_services),
+        "cloud": _non_empty(item.affected_cloud),
     }
     message = NotificationMessage(
         title=item.title,
@@ -99,7 +112,7 @@ def build_notification_message(
         url=item.url,
         source=item.source,
         published=item.published,
-        affected={key: [value for value in values if value] for key, values in affected.items()},
+        affected=affected,
         tags=item.tags,
     )
     metadata = NotificationMetadata(
@@ -107,3 +120,8 @@ def build_notification_message(
         rationale=score.rationale if score else [],
     )
     return message, metadata
+
+
+def _non_empty(values: list[str]) -> list[str]:
+    # Usually nothing needs dropping, so share the item's list instead of copying it.
+    return values if all(values) else [value for value in values if value]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 
 
 @dataclass
@@ -16,6 +17,19 @@ class NotificationMessage:
     affected: dict[str, list[str]] = field(default_factory=dict)
     tags: list[str] = field(default_factory=list)
 
+    # Shared by every notifier a message fans out to.
+    @cached_property
+    def published_iso(self) -> str:
+        return self.published.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    @cached_property
+    def priority_key(self) -> str:
+        return self.priority.lower()
+
+    @cached_property
+    def source_label(self) -> str:
+        return self.source.upper()
+
 
 @dataclass
 class NotificationMetadata:
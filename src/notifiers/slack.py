@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timezone
+import asyncio
 import logging
-import time
+import random
 from typing import Any
 
 import httpx
 
-from .base import BaseNotifier
+from ..json_codec import encode_json
+from .base import SEND_ATTEMPTS, BaseNotifier, backoff_delay, rate_limit_delay, shorten
 from .message import NotificationMessage, NotificationMetadata
 
 
@@ -19,6 +20,8 @@ SEVERITY_COLORS = {
     "p3": "#95A5A6",
 }
 
+_DESCRIPTION_LIMIT = 300
+
 
 @dataclass
 class SlackSettings:
@@ -31,35 +34,44 @@ class SlackNotifier(BaseNotifier):
     def __init__(self, settings: SlackSettings) -> None:
         self._settings = settings
         self._logger = logging.getLogger(__name__)
+        self._headers = {"User-Agent": settings.user_agent, "Content-Type": "application/json"}
+        self._rng = random.Random()
 
     async def send(self, message: NotificationMessage, metadata: NotificationMetadata) -> bool:
-        payload = _build_payload(message, metadata)
-        headers = {"User-Agent": self._settings.user_agent}
-
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            for attempt in range(3):
-                response = await client.post(self._settings.webhook_url, json=payload, headers=headers)
-                if response.status_code == 429:
-                    retry_after = _retry_after(response)
-                    self._logger.warning("Slack rate limit hit, sleeping %.2fs", retry_after)
-                    time.sleep(retry_after)
-                    continue
-                if 200 <= response.status_code < 300:
-                    return True
-                self._logger.error("Slack webhook failed with status %s", response.status_code)
-            return False
+        body = encode_json(_build_payload(message, metadata))
+
+        client = self._http_client(self._settings.timeout_seconds)
+        for attempt in range(SEND_ATTEMPTS):
+            last_attempt = attempt == SEND_ATTEMPTS - 1
+            try:
+                response = await client.post(self._settings.webhook_url, content=body, headers=self._headers)
+            except httpx.TransportError as exc:
+                if last_attempt:
+                    raise
+                self._logger.warning("Slack webhook request failed, retrying: %s", exc)
+                await asyncio.sleep(backoff_delay(attempt, self._rng))
+                continue
+            if response.status_code == 429:
+                retry_after = rate_limit_delay(_retry_after(response), attempt, self._rng)
+                self._logger.warning("Slack rate limit hit, sleeping %.2fs", retry_after)
+                await asyncio.sleep(retry_after)
+                continue
+            if 200 <= response.status_code < 300:
+                return True
+            self._logger.error("Slack webhook failed with status %s", response.status_code)
+            # Client errors won't succeed on retry; back off on server errors.
+            if response.status_code < 500 or last_attempt:
+                return False
+            await asyncio.sleep(backoff_delay(attempt, self._rng))
+        return False
 
 
 def _build_payload(message: NotificationMessage, metadata: NotificationMetadata) -> dict[str, Any]:
-    severity_key = message.priority.lower()
-    color = SEVERITY_COLORS.get(severity_key, SEVERITY_COLORS["low"])
-    description = message.summary
-    if len(description) > 300:
-        description = description[:297] + "..."
+    severity_key = message.priority_key
+    color = SEVERITY_COLORS.get(severity_key, SEVERITY_COLORS["p3"])
 
     reason_text = "\n".join(metadata.reasons[:5]) if metadata.reasons else "Matched your stack"
     rationale_text = "\n".join(metadata.rationale[:2]) if metadata.rationale else "Scored with defaults"
-    timestamp = message.published.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
     return {
         "attachments": [
@@ -67,10 +79,10 @@ def _build_payload(message: NotificationMessage, metadata: NotificationMetadata)
                 "color": color,
                 "title": message.title,
                 "title_link": message.url,
-                "text": description,
+                "text": shorten(message.summary, _DESCRIPTION_LIMIT),
                 "fields": [
                     {"title": "Priority", "value": f"{message.priority} ({message.score})", "short": True},
-                    {"title": "Source", "value": message.source.upper(), "short": True},
+                    {"title": "Source", "value": message.source_label, "short": True},
                     {"title": "Why you're seeing this", "value": reason_text, "short": False},
                     {"title": "Scoring", "value": rationale_text, "short": False},
                 ],
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timezone
 import logging
 from typing import Any
 
-import httpx
-
+from ..json_codec import encode_json
 from .base import BaseNotifier
 from .message import NotificationMessage, NotificationMetadata
 
@@ -23,22 +21,20 @@ class WebhookNotifier(BaseNotifier):
     def __init__(self, settings: WebhookSettings) -> None:
         self._settings = settings
         self._logger = logging.getLogger(__name__)
+        self._headers = {"User-Agent": settings.user_agent, "Content-Type": "application/json", **settings.headers}
 
     async def send(self, message: NotificationMessage, metadata: NotificationMetadata) -> bool:
-        payload = _build_payload(message, metadata)
-        headers = {"User-Agent": self._settings.user_agent}
-        headers.update(self._settings.headers)
+        body = encode_json(_build_payload(message, metadata))
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout_seconds) as client:
-            response = await client.post(self._settings.url, json=payload, headers=headers)
-            if 200 <= response.status_code < 300:
-                return True
-            self._logger.error("Webhook failed with status %s", response.status_code)
-            return False
+        client = self._http_client(self._settings.timeout_seconds)
+        response = await client.post(self._settings.url, content=body, headers=self._headers)
+        if 200 <= response.status_code < 300:
+            return True
+        self._logger.error("Webhook failed with status %s", response.status_code)
+        return False
 
 
 def _build_payload(message: NotificationMessage, metadata: NotificationMetadata) -> dict[str, Any]:
-    published = message.published.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
     return {
         "title": message.title,
         "summary": message.summary,
@@ -46,7 +42,7 @@ def _build_payload(message: NotificationMessage, metadata: NotificationMetadata)
         "score": message.score,
         "url": message.url,
         "source": message.source,
-        "published": published,
+        "published": message.published_iso,
         "affected": message.affected,
         "tags": message.tags,
         "reasons": metadata.reasons,
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import timezone
+from functools import lru_cache
 import math
+import time
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from .config import ScoringConfig, StackConfig
-from .feeds.base import FeedItem
+from .feeds.base import FeedItem, normalize_severity
 from .matcher import MatchResult
 
 
@@ -24,26 +31,39 @@ SEVERITY_MAP = {
 }
 
 
+# Strongest signal first; the first populated hit set decides relevance.
+_RELEVANCE_RULES = (
+    ("direct_package_hits", 100, "Direct dependency match"),
+    ("transitive_package_hits", 70, "Transitive dependency match"),
+    ("service_hits", 60, "Service match"),
+    ("cloud_hits", 50, "Cloud match"),
+    ("keyword_hits", 35, "Keyword match"),
+    ("language_hits", 25, "Language match"),
+)
+
+
 def score_alert(
     item: FeedItem,
     match: MatchResult,
     scoring: ScoringConfig,
     stack: StackConfig,
+    now: float | None = None,
 ) -> AlertScore:
+    """Score an alert; pass ``now`` (epoch seconds) to share one clock reading across a batch."""
     if not scoring.enabled:
         return AlertScore(score=0, priority="P3", rationale=["Scoring disabled"])
 
     severity_score, severity_reason = _score_severity(item)
     exploitability_score, exploitability_reasons = _score_exploitability(item, scoring)
     relevance_score, relevance_reasons = _score_relevance(match, stack)
-    recency_score, recency_reason = _score_recency(item)
+    recency_score, recency_reason = _score_recency(item, time.time() if now is None else now)
 
-    weights = scoring.weights
+    w_severity, w_exploitability, w_relevance, w_recency = scoring.weight_vector
     weighted = (
-        severity_score * weights.get("severity", 0.45)
-        + exploitability_score * weights.get("exploitability", 0.25)
-        + relevance_score * weights.get("relevance", 0.2)
-        + recency_score * weights.get("recency", 0.1)
+        severity_score * w_severity
+        + exploitability_score * w_exploitability
+        + relevance_score * w_relevance
+        + recency_score * w_recency
     )
     boost = _source_boost(item, scoring)
     total = min(100, int(round(weighted + boost)))
@@ -66,30 +86,28 @@ def _score_severity(item: FeedItem) -> tuple[int, str | None]:
     if item.cvss_score is not None:
         score = int(round(min(max(item.cvss_score, 0.0), 10.0) * 10))
         return score, f"CVSS {item.cvss_score:.1f}"
-    if item.severity:
-        mapped = SEVERITY_MAP.get(item.severity.lower())
+    # Feeds already normalize severity; the lookup returns known labels without re-lowering.
+    severity = normalize_severity(item.severity)
+    if severity:
+        mapped = SEVERITY_MAP.get(severity)
         if mapped is not None:
-            return mapped, f"Vendor severity {item.severity.lower()}"
+            return mapped, f"Vendor severity {severity}"
     return 0, None
 
 
 def _score_exploitability(item: FeedItem, scoring: ScoringConfig) -> tuple[int, list[str]]:
     score = 0
     reasons: list[str] = []
-    text = f"{item.title} {item.description}".lower()
-    if item.source.lower() == "cisa" or "kev" in [tag.lower() for tag in item.tags]:
+    text = item.text_lower
+    if item.source.lower() == "cisa" or "kev" in item.tags_lower:
         score += 60
         reasons.append("CISA KEV listed")
-    for keyword in scoring.keywords.get("exploited_in_wild", []):
-        if keyword.lower() in text:
-            score += 20
-            reasons.append("Exploited in the wild keyword")
-            break
-    for keyword in scoring.keywords.get("poc", []):
-        if keyword.lower() in text:
-            score += 10
-            reasons.append("PoC keyword")
-            break
+    if _mentions_any(text, scoring.exploited_keywords):
+        score += 20
+        reasons.append("Exploited in the wild keyword")
+    if _mentions_any(text, scoring.poc_keywords):
+        score += 10
+        reasons.append("PoC keyword")
     epss = _extract_epss(item.raw_data)
     if epss is not None and epss >= 0.5:
         score += 10
@@ -97,6 +115,25 @@ def _score_exploitability(item: FeedItem, scoring: ScoringConfig) -> tuple[int,
     return min(score, 100), reasons
 
 
+def _mentions_any(text: str, keywords: tuple[str, ...]) -> bool:
+    automaton = _keyword_automaton(keywords)
+    if automaton is None:
+        return any(keyword in text for keyword in keywords)
+    return next(automaton.iter(text), None) is not None
+
+
+@lru_cache(maxsize=16)
+def _keyword_automaton(keywords: tuple[str, ...]) -> ahocorasick.Automaton | None:
+    # An empty keyword matches everything, which the plain substring check handles.
+    if ahocorasick is None or not keywords or "" in keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 def _extract_epss(raw: dict) -> float | None:
     for key in ("epss", "epssScore", "epss_score"):
         value = raw.get(key)
@@ -109,24 +146,11 @@ def _score_relevance(match: MatchResult, stack: StackConfig) -> tuple[int, list[
     reasons: list[str] = []
     details = match.details
     score = 0
-    if details.direct_package_hits:
-        score = 100
-        reasons.append("Direct dependency match")
-    elif details.transitive_package_hits:
-        score = 70
-        reasons.append("Transitive dependency match")
-    elif details.service_hits:
-        score = 60
-        reasons.append("Service match")
-    elif details.cloud_hits:
-        score = 50
-        reasons.append("Cloud match")
-    elif details.keyword_hits:
-        score = 35
-        reasons.append("Keyword match")
-    elif details.language_hits:
-        score = 25
-        reasons.append("Language match")
+    for attr, rule_score, reason in _RELEVANCE_RULES:
+        if getattr(details, attr):
+            score = rule_score
+            reasons.append(reason)
+            break
 
     criticality_boost = _criticality_boost(details, stack)
     if criticality_boost:
@@ -136,24 +160,20 @@ def _score_relevance(match: MatchResult, stack: StackConfig) -> tuple[int, list[
 
 
 def _criticality_boost(details, stack: StackConfig) -> float:
-    boost = 0.0
-    for service in details.service_hits:
-        weight = stack.asset_criticality.services.get(service)
-        if weight:
-            boost = max(boost, 10.0 * weight)
-    for package in details.direct_package_hits | details.transitive_package_hits:
-        weight = stack.asset_criticality.packages.get(package)
-        if weight:
-            boost = max(boost, 10.0 * weight)
-    return boost
-
-
-def _score_recency(item: FeedItem) -> tuple[int, str | None]:
-    now = datetime.now(timezone.utc)
+    criticality = stack.asset_criticality
+    # Intersect with the (small) criticality tables instead of probing them once per hit.
+    weights = [criticality.services[service] for service in details.service_hits & criticality.services.keys()]
+    if criticality.packages:
+        package_hits = details.direct_package_hits | details.transitive_package_hits
+        weights.extend(criticality.packages[package] for package in package_hits & criticality.packages.keys())
+    return max([0.0, *(10.0 * weight for weight in weights if weight)])
+
+
+def _score_recency(item: FeedItem, now: float) -> tuple[int, str | None]:
     published = item.published
     if published.tzinfo is None:
         published = published.replace(tzinfo=timezone.utc)
-    age_days = max(0.0, (now - published).total_seconds() / 86400)
+    age_days = max(0.0, (now - published.timestamp()) / 86400)
     score = max(0, int(round(100 - age_days * 3)))
     if score <= 0:
         return 0, None
@@ -161,18 +181,13 @@ def _score_recency(item: FeedItem) -> tuple[int, str | None]:
 
 
 def _source_boost(item: FeedItem, scoring: ScoringConfig) -> int:
-    preferred = {source.lower() for source in scoring.prefer_sources}
-    if item.source.lower() in preferred:
+    if item.source.lower() in scoring.preferred_sources:
         return 3
     return 0
 
 
 def _priority_for_score(score: int, scoring: ScoringConfig) -> str:
-    thresholds = scoring.thresholds
-    if score >= thresholds.get("P0", 85):
-        return "P0"
-    if score >= thresholds.get("P1", 70):
-        return "P1"
-    if score >= thresholds.get("P2", 50):
-        return "P2"
+    for cutoff, priority in scoring.priority_cutoffs:
+        if score >= cutoff:
+            return priority
     return "P3"
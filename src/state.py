@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-import json
+import errno
 import os
+import time
 from typing import Any
 
+from .json_codec import encode_json, parse_json
+
 
 STATE_VERSION = 1
 
@@ -13,13 +16,15 @@ STATE_VERSION = 1
 @dataclass
 class State:
     last_poll: datetime | None
-    sent_items: dict[str, datetime] = field(default_factory=dict)
+    # Epoch seconds when each item was sent; converted to ISO only on save.
+    sent_items: dict[str, float] = field(default_factory=dict)
     version: int = STATE_VERSION
+    # Validators (etag / last_modified) from the last response, keyed by URL.
+    http_cache: dict[str, dict[str, str]] = field(default_factory=dict)
 
 
 def _parse_datetime(value: str) -> datetime:
-    if value.endswith("Z"):
-        value = value[:-1] + "+00:00"
+    # fromisoformat accepts the trailing "Z" directly since Python 3.11.
     return datetime.fromisoformat(value)
 
 
@@ -31,8 +36,8 @@ def load_state(path: str) -> State:
     if not os.path.exists(path):
         return State(last_poll=None, sent_items={})
 
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    with open(path, "rb") as handle:
+        raw = parse_json(handle.read())
 
     if not isinstance(raw, dict):
         return State(last_poll=None, sent_items={})
@@ -41,22 +46,48 @@ def load_state(path: str) -> State:
     last_poll = _parse_datetime(last_poll_raw) if isinstance(last_poll_raw, str) else None
 
     sent_items = _parse_sent_items(raw.get("sent_items"))
+    http_cache = _parse_http_cache(raw.get("http_cache"))
 
-    return State(last_poll=last_poll, sent_items=sent_items, version=int(raw.get("version", 1)))
+    return State(
+        last_poll=last_poll,
+        sent_items=sent_items,
+        version=int(raw.get("version", 1)),
+        http_cache=http_cache,
+    )
 
 
 def save_state(path: str, state: State) -> None:
     payload = {
         "version": state.version,
         "last_poll": _to_iso(state.last_poll) if state.last_poll else None,
-        "sent_items": {item_id: _to_iso(ts) for item_id, ts in state.sent_items.items()},
+        "sent_items": {
+            item_id: _to_iso(datetime.fromtimestamp(ts, timezone.utc)) for item_id, ts in state.sent_items.items()
+        },
+        "http_cache": state.http_cache,
     }
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
+    data = encode_json(payload, sort_keys=True)
+    # Write beside the target and rename so an interrupted save can't leave a torn file.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    try:
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        # A state file bind-mounted on its own (the Docker setup) can't be
+        # renamed over; rewrite it in place instead.
+        if exc.errno not in (errno.EBUSY, errno.EXDEV):
+            raise
+        os.remove(tmp_path)
+        with open(path, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
 
 
 def mark_sent(state: State, item_id: str, timestamp: datetime | None = None) -> None:
-    state.sent_items[item_id] = timestamp or datetime.now(timezone.utc)
+    state.sent_items[item_id] = timestamp.timestamp() if timestamp else time.time()
 
 
 def was_sent(state: State, item_id: str) -> bool:
@@ -64,27 +95,49 @@ def was_sent(state: State, item_id: str) -> bool:
 
 
 def prune_sent(state: State, days: int = 30) -> None:
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-    state.sent_items = {
-        item_id: ts for item_id, ts in state.sent_items.items() if ts >= cutoff
-    }
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+    # Delete in place; most entries survive, so rebuilding the dict would copy them all.
+    sent_items = state.sent_items
+    for item_id in [item_id for item_id, ts in sent_items.items() if ts < cutoff]:
+        del sent_items[item_id]
 
 
-def _parse_sent_items(value: Any) -> dict[str, datetime]:
-    now = datetime.now(timezone.utc)
+def _parse_sent_items(value: Any) -> dict[str, float]:
+    now = time.time()
     if value is None:
         return {}
     if isinstance(value, list):
         return {str(item_id): now for item_id in value}
     if isinstance(value, dict):
-        parsed: dict[str, datetime] = {}
+        parsed: dict[str, float] = {}
         for item_id, ts in value.items():
             if isinstance(ts, str):
                 try:
-                    parsed[str(item_id)] = _parse_datetime(ts)
+                    sent_at = _parse_datetime(ts)
                 except ValueError:
                     parsed[str(item_id)] = now
+                    continue
+                if sent_at.tzinfo is None:
+                    sent_at = sent_at.replace(tzinfo=timezone.utc)
+                parsed[str(item_id)] = sent_at.timestamp()
             else:
                 parsed[str(item_id)] = now
         return parsed
     return {}
+
+
+def _parse_http_cache(value: Any) -> dict[str, dict[str, str]]:
+    if not isinstance(value, dict):
+        return {}
+    parsed: dict[str, dict[str, str]] = {}
+    for url, validators in value.items():
+        if not isinstance(validators, dict):
+            continue
+        entry = {
+            key: validators[key]
+            for key in ("etag", "last_modified")
+            if isinstance(validators.get(key), str)
+        }
+        if entry:
+            parsed[str(url)] = entry
+    return parsed
@@ -7,6 +7,9 @@ from src.matcher import MatchDetails, MatchResult
 from src.scoring import AlertScore
 
 
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
 def _make_item(
     title: str = "Test alert",
     description: str = "Test description",
@@ -20,7 +23,7 @@ def _make_item(
         title=title,
         description=description,
         url="https://example.com",
-        published=datetime.now(timezone.utc),
+        published=_NOW,
         severity=None,
         cvss_score=None,
         affected_packages=affected_packages or [],
@@ -33,7 +36,7 @@ def _make_match(details: MatchDetails | None = None) -> MatchResult:
     return MatchResult(
         is_relevant=True,
         reasons=["Direct package match: lodash"],
-        details=details or MatchDetails(direct_package_hits={"lodash"}),
+        details=details or MatchDetails(direct_package_hits=frozenset({"lodash"})),
     )
 
 
@@ -62,7 +65,7 @@ class DecisionTests(unittest.TestCase):
 
     def test_loud_pages_on_any_relevant_alert(self) -> None:
         item = _make_item()
-        details = MatchDetails(keyword_hits={"kubernetes"})
+        details = MatchDetails(keyword_hits=frozenset({"kubernetes"}))
         match = _make_match(details)
         score = AlertScore(score=5, priority="P3", rationale=[])
         decision = classify_alert(item, match, score, "loud", [], True)
@@ -70,7 +73,7 @@ class DecisionTests(unittest.TestCase):
 
     def test_default_behavior_when_mode_absent(self) -> None:
         item = _make_item()
-        details = MatchDetails(keyword_hits={"kubernetes"})
+        details = MatchDetails(keyword_hits=frozenset({"kubernetes"}))
         match = _make_match(details)
         score = AlertScore(score=5, priority="P3", rationale=[])
         decision = classify_alert(item, match, score, "normal", [], False)
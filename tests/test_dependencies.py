@@ -41,6 +41,54 @@ class DependencyLoaderTests(unittest.TestCase):
             self.assertIn("lodash", graph.direct.get("npm", set()))
             self.assertIn("left-pad", graph.transitive.get("npm", set()))
 
+    def test_lockfile_uses_innermost_name_for_nested_packages(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            lockfile = {
+                "packages": {
+                    "": {},
+                    "node_modules/react": {"version": "18.0.0"},
+                    "node_modules/react/node_modules/@babel/core": {"version": "7.0.0"},
+                }
+            }
+            (root / "package-lock.json").write_text(json.dumps(lockfile), encoding="utf-8")
+
+            config = DependenciesConfig(
+                enabled=True,
+                sources=[DependencySource(type="lockfile", path="package-lock.json")],
+                include_transitive=True,
+                ecosystems=["npm"],
+            )
+            graph = load_dependency_graph(config, root, normalize_names=True)
+
+            self.assertEqual(graph.transitive.get("npm"), {"react", "@babel/core"})
+
+    def test_loads_nested_v1_lockfile(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            lockfile = {
+                "lockfileVersion": 1,
+                "dependencies": {
+                    "express": {
+                        "version": "4.18.0",
+                        "requires": {"body-parser": "1.20.0"},
+                        "dependencies": {"lodash.merge": {"version": "4.6.2"}},
+                    },
+                    "body-parser": {"version": "1.20.0"},
+                },
+            }
+            (root / "package-lock.json").write_text(json.dumps(lockfile), encoding="utf-8")
+
+            config = DependenciesConfig(
+                enabled=True,
+                sources=[DependencySource(type="lockfile", path="package-lock.json")],
+                include_transitive=True,
+                ecosystems=["npm"],
+            )
+            graph = load_dependency_graph(config, root, normalize_names=True)
+
+            self.assertEqual(graph.transitive.get("npm"), {"express", "body-parser", "lodash.merge"})
+
     def test_loads_requirements_and_poetry_lock(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timezone
+
+from src.config import (
+    AssetCriticalityConfig,
+    CISAConfig,
+    Config,
+    FeedsConfig,
+    HackerNewsConfig,
+    NotificationConfig,
+    OSVConfig,
+    ScoringConfig,
+    ScoringThresholds,
+    ScoringWeights,
+    Settings,
+    StackConfig,
+    StackDepsConfig,
+    StackMatchConfig,
+)
+from src.dependencies.types import DependencyGraph
+from src.feeds.base import FeedItem
+from src.main import _poll_once
+from src.state import State
+
+
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _StaticFeed:
+    def __init__(self, items: list[FeedItem]) -> None:
+        self._items = items
+
+    async def fetch_recent(self, since: datetime | None = None) -> list[FeedItem]:
+        return self._items
+
+
+class _RecordingNotifier:
+    max_batch_size = 1
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(self, message, metadata) -> bool:
+        self.sent.append(message.title)
+        return True
+
+    async def send_batch(self, entries) -> bool:
+        return all([await self.send(message, metadata) for message, metadata in entries])
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _item(item_id: str, ecosystem: str, package: str) -> FeedItem:
+    return FeedItem(
+        id=item_id,
+        source="osv",
+        title=f"{item_id} in {package}",
+        description="Remote code execution",
+        url="https://example.com",
+        published=_NOW,
+        severity="CRITICAL",
+        cvss_score=9.8,
+        affected_packages=[package],
+        raw_data={},
+        ecosystems=[ecosystem],
+    )
+
+
+def _config(packages: dict[str, list[str]]) -> Config:
+    return Config(
+        mode="normal",
+        mode_explicit=False,
+        always_page=[],
+        version=1,
+        stack=StackConfig(
+            cloud=[],
+            languages=[],
+            packages=packages,
+            services=[],
+            keywords=[],
+            deps=StackDepsConfig(enabled=False, sources=[], include_transitive=False, ecosystems=[]),
+            match=StackMatchConfig(mode="strict", synonyms=False, normalize_names=True),
+            synonyms={},
+            asset_criticality=AssetCriticalityConfig(services={}, packages={}),
+        ),
+        notifications=NotificationConfig(targets=[], used_legacy=False),
+        settings=Settings(
+            poll_interval_minutes=15,
+            state_file="./state.json",
+            include_low_severity=False,
+            max_results_per_feed=10,
+            request_timeout_seconds=5,
+            user_agent="signl/test",
+            max_notifications_per_run=5,
+            min_cvss_score=None,
+        ),
+        feeds=FeedsConfig(
+            nvd=False,
+            github=False,
+            msrc=False,
+            rss=[],
+            hackernews=HackerNewsConfig(enabled=False, max_terms=1),
+            osv=OSVConfig(enabled=False),
+            cisa=CISAConfig(enabled=False),
+        ),
+        scoring=ScoringConfig(
+            enabled=True,
+            weights=ScoringWeights(severity=0.45, exploitability=0.25, relevance=0.2, recency=0.1),
+            thresholds=ScoringThresholds(P0=85, P1=70, P2=50, P3=0),
+            prefer_sources=[],
+            keywords={"exploited_in_wild": [], "poc": []},
+        ),
+    )
+
+
+class PollDedupeTests(unittest.IsolatedAsyncioTestCase):
+    async def _poll(self, packages: dict[str, list[str]], *feeds: list[FeedItem]) -> tuple[State, list[str]]:
+        notifier = _RecordingNotifier()
+        state = State(last_poll=None)
+        await _poll_once(
+            [_StaticFeed(items) for items in feeds],
+            [notifier],
+            _config(packages),
+            state,
+            DependencyGraph(),
+            dry_run=False,
+        )
+        return state, notifier.sent
+
+    async def test_duplicate_id_is_notified_once(self) -> None:
+        state, sent = await self._poll(
+            {"npm": ["left-pad"], "pypi": ["requests"]},
+            [_item("GHSA-1", "npm", "left-pad"), _item("GHSA-1", "npm", "left-pad")],
+            [_item("GHSA-1", "pypi", "requests")],
+        )
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(list(state.sent_items), ["GHSA-1"])
+
+    async def test_copies_from_other_ecosystems_do_not_cross_match(self) -> None:
+        # left-pad is only in the npm stack and requests only in pypi, so
+        # neither copy is relevant on its own ecosystem.
+        state, sent = await self._poll(
+            {"npm": ["left-pad"], "pypi": ["requests"]},
+            [_item("GHSA-2", "npm", "requests")],
+            [_item("GHSA-2", "pypi", "left-pad")],
+        )
+
+        self.assertEqual(sent, [])
+        self.assertEqual(state.sent_items, {})
@@ -9,6 +9,9 @@ from src.matcher import calculate_relevance
 from datetime import datetime, timezone
 
 
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
 class MatchingTests(unittest.TestCase):
     def _stack(self, mode: str) -> StackConfig:
         return StackConfig(
@@ -30,7 +33,7 @@ class MatchingTests(unittest.TestCase):
             title="K8s CVE",
             description="Issue in k8s clusters.",
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity=None,
             cvss_score=None,
             affected_packages=[],
@@ -47,7 +50,7 @@ class MatchingTests(unittest.TestCase):
             title="K8s advisory",
             description="k8s issue",
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity=None,
             cvss_score=None,
             affected_packages=[],
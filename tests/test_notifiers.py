@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
@@ -16,6 +17,8 @@ from src.config import (
     OSVConfig,
     CISAConfig,
     ScoringConfig,
+    ScoringThresholds,
+    ScoringWeights,
     Settings,
     StackConfig,
     StackDepsConfig,
@@ -23,14 +26,23 @@ from src.config import (
 )
 from src.feeds.base import FeedItem
 from src.matcher import MatchDetails, MatchResult
+from src.notifiers.discord import DiscordNotifier, DiscordSettings
 from src.notifiers.factory import build_notifiers, build_notification_message
+from src.notifiers.message import NotificationMessage, NotificationMetadata
 from src.notifiers.webhook import WebhookNotifier
 from src.scoring import AlertScore
 
 
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
 class NotifierTests(unittest.IsolatedAsyncioTestCase):
     def _config(self) -> Config:
         return Config(
+            mode="normal",
+            mode_explicit=False,
+            always_page=[],
+            version=1,
             stack=StackConfig(
                 cloud=[],
                 languages=[],
@@ -69,26 +81,23 @@ class NotifierTests(unittest.IsolatedAsyncioTestCase):
             ),
             scoring=ScoringConfig(
                 enabled=True,
-                weights={"severity": 0.45, "exploitability": 0.25, "relevance": 0.2, "recency": 0.1},
-                thresholds={"P0": 85, "P1": 70, "P2": 50, "P3": 0},
+                weights=ScoringWeights(severity=0.45, exploitability=0.25, relevance=0.2, recency=0.1),
+                thresholds=ScoringThresholds(P0=85, P1=70, P2=50, P3=0),
                 prefer_sources=[],
                 keywords={"exploited_in_wild": [], "poc": []},
             ),
         )
 
-    async def test_webhook_payload_contains_priority(self) -> None:
-        config = self._config()
-        notifiers = build_notifiers(config)
-        self.assertEqual(len(notifiers), 1)
-        self.assertIsInstance(notifiers[0], WebhookNotifier)
-
+    def _message(
+        self, title: str = "Test alert", description: str = "Summary"
+    ) -> tuple[NotificationMessage, NotificationMetadata]:
         item = FeedItem(
             id="test",
             source="rss",
-            title="Test alert",
-            description="Summary",
+            title=title,
+            description=description,
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity=None,
             cvss_score=None,
             affected_packages=["requests"],
@@ -96,14 +105,62 @@ class NotifierTests(unittest.IsolatedAsyncioTestCase):
         )
         match = MatchResult(is_relevant=True, reasons=["Direct package match"], details=MatchDetails())
         score = AlertScore(score=88, priority="P0", rationale=["CVSS 9.8"])
-        message, metadata = build_notification_message(item, match.reasons, match, score)
+        return build_notification_message(item, match.reasons, match, score)
+
+    async def test_webhook_payload_contains_priority(self) -> None:
+        config = self._config()
+        notifiers = build_notifiers(config)
+        self.assertEqual(len(notifiers), 1)
+        self.assertIsInstance(notifiers[0], WebhookNotifier)
 
-        with patch("httpx.AsyncClient") as mock_client:
-            instance = mock_client.return_value.__aenter__.return_value
-            instance.post = AsyncMock(return_value=httpx.Response(200))
-            success = await notifiers[0].send(message, metadata)
+        message, metadata = self._message()
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post.return_value = httpx.Response(200)
+        notifiers[0]._client = client
+        success = await notifiers[0].send(message, metadata)
+        second = await notifiers[0].send(message, metadata)
 
         self.assertTrue(success)
-        payload = instance.post.call_args.kwargs.get("json")
+        self.assertTrue(second)
+        self.assertEqual(client.post.await_count, 2)
+        payload = json.loads(client.post.call_args.kwargs["content"])
         self.assertEqual(payload["priority"], "P0")
         self.assertEqual(payload["score"], 88)
+
+    async def test_send_batch_defaults_to_one_send_per_entry(self) -> None:
+        notifier = build_notifiers(self._config())[0]
+        message, metadata = self._message()
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post.side_effect = [httpx.Response(200), httpx.Response(500)]
+        notifier._client = client
+        delivered = await notifier.send_batch([(message, metadata), (message, metadata)])
+
+        self.assertFalse(delivered)
+        self.assertEqual(client.post.await_count, 2)
+
+    async def test_discord_batch_splits_at_embed_text_limit(self) -> None:
+        notifier = DiscordNotifier(
+            DiscordSettings(webhook_url="https://discord.example/hook", timeout_seconds=5, user_agent="signl-test")
+        )
+        entries = [self._message("Advisory " * 30, "Details " * 100) for _ in range(10)]
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post.return_value = httpx.Response(204)
+        notifier._client = client
+        with patch("src.notifiers.discord.asyncio.sleep", new=AsyncMock()):
+            delivered = await notifier.send_batch(entries)
+
+        self.assertTrue(delivered)
+        bodies = [json.loads(call.kwargs["content"]) for call in client.post.call_args_list]
+        self.assertGreater(len(bodies), 1)
+        self.assertEqual(sum(len(body["embeds"]) for body in bodies), 10)
+        for body in bodies:
+            text = sum(
+                len(embed["title"])
+                + len(embed["description"])
+                + sum(len(field["name"]) + len(field["value"]) for field in embed["fields"])
+                for embed in body["embeds"]
+            )
+            self.assertLessEqual(text, 6000)
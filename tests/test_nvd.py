@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from src.feeds import nvd
+from src.feeds.nvd import NVDFeed, NVDSettings
+
+
+class NVDPrefetchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_parse_failure_cancels_prefetched_page(self) -> None:
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.params["startIndex"])
+            return httpx.Response(200, content=json.dumps({"totalResults": 2, "vulnerabilities": []}))
+
+        settings = NVDSettings(max_results=1, user_agent="signl-test")
+        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch.object(nvd, "_parse_items", side_effect=ValueError("bad page")):
+                with self.assertRaises(ValueError):
+                    await NVDFeed(settings, client).fetch_recent(since)
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        self.assertEqual(pending, [])
+        self.assertEqual(requested, ["0"])
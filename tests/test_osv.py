@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import json
+import unittest
+
+import httpx
+
+from src.feeds.osv import OSVFeed, OSVSettings
+
+
+_SINCE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class OSVFeedTests(unittest.IsolatedAsyncioTestCase):
+    async def test_follows_page_tokens_and_fetches_recent_vulns(self) -> None:
+        batch_bodies: list[dict] = []
+        fetched: list[str] = []
+        pages = iter(
+            [
+                {
+                    "results": [
+                        {
+                            "vulns": [{"id": "GHSA-new", "modified": "2025-02-01T00:00:00Z"}],
+                            "next_page_token": "page-2",
+                        }
+                    ]
+                },
+                {
+                    "results": [
+                        {
+                            "vulns": [
+                                {"id": "GHSA-old", "modified": "2024-01-01T00:00:00Z"},
+                                {"id": "GHSA-paged", "modified": "2025-03-01T00:00:00Z"},
+                            ]
+                        }
+                    ]
+                },
+            ]
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/querybatch":
+                batch_bodies.append(json.loads(request.content))
+                return httpx.Response(200, json=next(pages))
+            vuln_id = request.url.path.rsplit("/", 1)[1]
+            fetched.append(vuln_id)
+            return httpx.Response(
+                200,
+                json={"id": vuln_id, "summary": "Issue", "published": "2025-02-01T00:00:00Z", "references": []},
+            )
+
+        settings = OSVSettings(packages={"npm": ["lodash"]}, max_results=10, user_agent="signl-test")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            items = await OSVFeed(settings, client).fetch_recent(_SINCE)
+
+        self.assertEqual([item.id for item in items], ["osv:GHSA-new", "osv:GHSA-paged"])
+        self.assertEqual(sorted(fetched), ["GHSA-new", "GHSA-paged"])
+        self.assertNotIn("page_token", batch_bodies[0]["queries"][0])
+        self.assertEqual(batch_bodies[1]["queries"][0]["page_token"], "page-2")
+        self.assertEqual(items[0].ecosystems, ["npm"])
+
+    async def test_failed_detail_fetch_cancels_siblings(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/querybatch":
+                vulns = [
+                    {"id": "GHSA-bad", "modified": "2025-02-01T00:00:00Z"},
+                    {"id": "GHSA-slow", "modified": "2025-02-01T00:00:00Z"},
+                ]
+                return httpx.Response(200, json={"results": [{"vulns": vulns}]})
+            if request.url.path.endswith("GHSA-bad"):
+                return httpx.Response(500)
+            await release.wait()
+            return httpx.Response(200, json={})
+
+        settings = OSVSettings(packages={"npm": ["lodash"]}, max_results=10, user_agent="signl-test")
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with self.assertRaises(ExceptionGroup) as raised:
+                await OSVFeed(settings, client).fetch_recent(_SINCE)
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        self.assertTrue(raised.exception.subgroup(httpx.HTTPStatusError))
+        self.assertEqual(pending, [])
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import tempfile
+import unittest
+
+import httpx
+
+from src.feeds.base import FeedItem
+from src.feeds.rss import RSSFeed, RSSSettings, RSSSource
+from src.state import State, load_state, save_state
+
+
+FEED_URL = "https://example.com/feed.xml"
+FEED_BODY = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss><channel>
+  <item>
+    <title>Example advisory</title>
+    <link>https://example.com/advisory</link>
+    <guid>advisory-1</guid>
+    <pubDate>Mon, 01 Jan 2035 00:00:00 GMT</pubDate>
+  </item>
+</channel></rss>
+"""
+
+
+class _BrokenStream(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield FEED_BODY[:40]
+        raise httpx.ReadError("connection reset")
+
+
+class RSSConditionalFetchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_revalidates_with_stored_etag(self) -> None:
+        seen_headers: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FEED_BODY, headers={"ETag": '"v1"'})
+
+        http_cache: dict[str, dict[str, str]] = {}
+        settings = RSSSettings(
+            sources=[RSSSource(name="Example", url=FEED_URL)],
+            user_agent="signl-test",
+            http_cache=http_cache,
+        )
+        since = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            feed = RSSFeed(settings, client)
+            first = await feed.fetch_recent(since)
+            second = await feed.fetch_recent(since)
+
+        self.assertEqual([item.id for item in first], ["rss:Example:advisory-1"])
+        self.assertEqual(second, [])
+        self.assertNotIn("If-None-Match", seen_headers[0])
+        self.assertEqual(seen_headers[1]["If-None-Match"], '"v1"')
+        self.assertEqual(http_cache, {FEED_URL: {"etag": '"v1"'}})
+
+    async def test_failed_body_read_does_not_store_validators(self) -> None:
+        responses = iter(
+            [
+                httpx.Response(200, headers={"ETag": '"v1"'}, stream=_BrokenStream()),
+                httpx.Response(200, content=FEED_BODY, headers={"ETag": '"v1"'}),
+            ]
+        )
+        seen_headers: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers)
+            return next(responses)
+
+        http_cache: dict[str, dict[str, str]] = {}
+        settings = RSSSettings(
+            sources=[RSSSource(name="Example", url=FEED_URL)],
+            user_agent="signl-test",
+            http_cache=http_cache,
+        )
+        since = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            feed = RSSFeed(settings, client)
+            first = await feed.fetch_recent(since)
+            self.assertEqual(http_cache, {})
+            second = await feed.fetch_recent(since)
+
+        self.assertEqual(first, [])
+        self.assertEqual([item.id for item in second], ["rss:Example:advisory-1"])
+        self.assertNotIn("If-None-Match", seen_headers[1])
+
+    async def test_stops_after_a_run_of_stale_items_when_newest_first(self) -> None:
+        source = RSSSource(name="Example", url=FEED_URL, newest_first=True)
+        items = await self._fetch_mixed_feed(source)
+
+        self.assertEqual([item.id for item in items], ["rss:Example:new-1", "rss:Example:new-2"])
+
+    async def test_reads_whole_feed_by_default(self) -> None:
+        items = await self._fetch_mixed_feed(RSSSource(name="Example", url=FEED_URL))
+
+        self.assertEqual(
+            [item.id for item in items],
+            ["rss:Example:new-1", "rss:Example:new-2", "rss:Example:new-3"],
+        )
+
+    async def _fetch_mixed_feed(self, source: RSSSource) -> list[FeedItem]:
+        def item(guid: str, year: int) -> str:
+            return (
+                f"<item><title>{guid}</title><guid>{guid}</guid>"
+                f"<pubDate>Mon, 01 Jan {year} 00:00:00 GMT</pubDate></item>"
+            )
+
+        entries = [item("new-1", 2035), item("old-1", 2001), item("new-2", 2035)]
+        entries += [item(f"old-{index}", 2001) for index in range(2, 6)]
+        entries.append(item("new-3", 2035))
+        body = f"<rss><channel>{''.join(entries)}</channel></rss>".encode()
+
+        settings = RSSSettings(sources=[source], user_agent="signl-test")
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await RSSFeed(settings, client).fetch_recent(datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+    async def test_reads_iso_dates_from_atom_entries(self) -> None:
+        body = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry><id>fresh</id><title>Fresh</title><updated>2035-01-01T00:00:00Z</updated></entry>
+  <entry><id>old</id><title>Old</title><updated>2001-01-01T00:00:00+02:00</updated></entry>
+</feed>
+"""
+        settings = RSSSettings(sources=[RSSSource(name="Example", url=FEED_URL)], user_agent="signl-test")
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            items = await RSSFeed(settings, client).fetch_recent(datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual([item.id for item in items], ["rss:Example:fresh"])
+        self.assertEqual(items[0].published, datetime(2035, 1, 1, tzinfo=timezone.utc))
+
+    def test_http_cache_round_trips_through_state_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "state.json")
+            state = State(
+                last_poll=None,
+                http_cache={FEED_URL: {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2035 00:00:00 GMT"}},
+            )
+            save_state(path, state)
+
+            loaded = load_state(path)
+
+        self.assertEqual(loaded.http_cache, state.http_cache)
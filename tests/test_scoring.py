@@ -3,12 +3,23 @@ from __future__ import annotations
 import unittest
 from datetime import datetime, timezone
 
-from src.config import AssetCriticalityConfig, ScoringConfig, StackConfig, StackDepsConfig, StackMatchConfig
+from src.config import (
+    AssetCriticalityConfig,
+    ScoringConfig,
+    ScoringThresholds,
+    ScoringWeights,
+    StackConfig,
+    StackDepsConfig,
+    StackMatchConfig,
+)
 from src.feeds.base import FeedItem
 from src.matcher import MatchDetails, MatchResult
 from src.scoring import score_alert
 
 
+_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
 def _stack() -> StackConfig:
     return StackConfig(
         cloud=[],
@@ -26,8 +37,8 @@ def _stack() -> StackConfig:
 def _scoring() -> ScoringConfig:
     return ScoringConfig(
         enabled=True,
-        weights={"severity": 0.45, "exploitability": 0.25, "relevance": 0.2, "recency": 0.1},
-        thresholds={"P0": 85, "P1": 70, "P2": 50, "P3": 0},
+        weights=ScoringWeights(severity=0.45, exploitability=0.25, relevance=0.2, recency=0.1),
+        thresholds=ScoringThresholds(P0=85, P1=70, P2=50, P3=0),
         prefer_sources=["cisa"],
         keywords={
             "exploited_in_wild": ["exploited in the wild"],
@@ -44,16 +55,16 @@ class ScoringTests(unittest.TestCase):
             title="CVE-0000-0000",
             description="Test",
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity="critical",
             cvss_score=9.8,
             affected_packages=[],
             raw_data={},
             tags=["kev"],
         )
-        details = MatchDetails(direct_package_hits={"lodash"})
+        details = MatchDetails(direct_package_hits=frozenset({"lodash"}))
         match = MatchResult(is_relevant=True, reasons=["Direct package match"], details=details)
-        score = score_alert(item, match, _scoring(), _stack())
+        score = score_alert(item, match, _scoring(), _stack(), now=_NOW.timestamp())
         self.assertEqual(score.priority, "P0")
 
     def test_transitive_medium_scores_lower(self) -> None:
@@ -63,15 +74,15 @@ class ScoringTests(unittest.TestCase):
             title="GHSA-1",
             description="Test",
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity="medium",
             cvss_score=None,
             affected_packages=[],
             raw_data={},
         )
-        details = MatchDetails(transitive_package_hits={"requests"})
+        details = MatchDetails(transitive_package_hits=frozenset({"requests"}))
         match = MatchResult(is_relevant=True, reasons=["Transitive match"], details=details)
-        score = score_alert(item, match, _scoring(), _stack())
+        score = score_alert(item, match, _scoring(), _stack(), now=_NOW.timestamp())
         self.assertLess(score.score, 50)
         self.assertEqual(score.priority, "P3")
 
@@ -82,14 +93,14 @@ class ScoringTests(unittest.TestCase):
             title="Vendor alert",
             description="Test",
             url="https://example.com",
-            published=datetime.now(timezone.utc),
+            published=_NOW,
             severity="critical",
             cvss_score=None,
             affected_packages=[],
             raw_data={},
         )
-        details = MatchDetails(service_hits={"kubernetes"})
+        details = MatchDetails(service_hits=frozenset({"kubernetes"}))
         match = MatchResult(is_relevant=True, reasons=["Service match"], details=details)
-        score = score_alert(item, match, _scoring(), _stack())
+        score = score_alert(item, match, _scoring(), _stack(), now=_NOW.timestamp())
         self.assertGreater(score.score, 0)
         self.assertTrue(any("Vendor severity" in reason for reason in score.rationale))
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.state import State, load_state, save_state
+
+
+class SaveStateTests(unittest.TestCase):
+    def test_falls_back_to_in_place_write_when_rename_is_busy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / "state.json")
+            save_state(path, State(last_poll=None))
+            state = State(last_poll=None, sent_items={"item-1": 1_700_000_000.0})
+
+            busy = OSError(errno.EBUSY, "Device or resource busy")
+            with patch("src.state.os.replace", side_effect=busy):
+                save_state(path, state)
+
+            loaded = load_state(path)
+            leftover = os.path.exists(f"{path}.tmp")
+
+        self.assertEqual(loaded.sent_items, state.sent_items)
+        self.assertFalse(leftover)